@@ -1,25 +1,233 @@
-```python
-import random
+import argparse
 import logging
+import time
 
-def run_ab_test():
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+logging.basicConfig(level=logging.INFO)
+
+CHUNK_SIZE = 1_000_000
+SAMPLE_SIZE = 200_000
+
+class VariantAggregates:
+    """Mergeable per-variant sufficient statistics plus a bounded uniform sample.
+
+    Counts, means, squared deviations and conversions (value > 0) are exact;
+    each chunk is merged with Chan's update so the variance stays accurate
+    over tens of millions of events. The sample keeps the `sample_size`
+    events with the smallest random keys (bottom-k sampling) and is only used
+    for bootstrap intervals.
+    """
+
+    def __init__(self, sample_size=SAMPLE_SIZE, seed=None):
+        self.sample_size = sample_size
+        self.rng = np.random.default_rng(seed)
+        self.index = {}
+        self.n = np.zeros(0, dtype=np.int64)
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.conversions = np.zeros(0, dtype=np.int64)
+        self.sample_values = {}
+        self.sample_keys = {}
+
+    @property
+    def variants(self):
+        return list(self.index)
+
+    def _codes(self, variants):
+        labels, codes = np.unique(np.asarray(variants).astype(str), return_inverse=True)
+        for label in labels:
+            if label not in self.index:
+                self.index[label] = len(self.index)
+                self.sample_values[label] = np.zeros(0)
+                self.sample_keys[label] = np.zeros(0)
+        grow = len(self.index) - len(self.n)
+        if grow:
+            self.n = np.pad(self.n, (0, grow))
+            self.mean = np.pad(self.mean, (0, grow))
+            self.m2 = np.pad(self.m2, (0, grow))
+            self.conversions = np.pad(self.conversions, (0, grow))
+        return labels, np.array([self.index[label] for label in labels])[codes]
+
+    def add(self, variants, values):
+        values = np.asarray(values, dtype=float)
+        labels, codes = self._codes(variants)
+        size = len(self.index)
+        n = np.bincount(codes, minlength=size)
+        seen = n > 0
+        mean = np.bincount(codes, weights=values, minlength=size) / np.maximum(n, 1)
+        m2 = np.bincount(codes, weights=(values - mean[codes]) ** 2, minlength=size)
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean[seen] += (delta * n / np.maximum(total, 1))[seen]
+        self.m2 += m2 + delta * delta * self.n * n / np.maximum(total, 1)
+        self.n = total
+        self.conversions += np.bincount(codes, weights=values > 0, minlength=size).astype(np.int64)
+
+        keys = self.rng.random(len(values))
+        for label in labels:
+            mask = codes == self.index[label]
+            merged_keys = np.concatenate([self.sample_keys[label], keys[mask]])
+            merged_values = np.concatenate([self.sample_values[label], values[mask]])
+            if len(merged_keys) > self.sample_size:
+                keep = np.argpartition(merged_keys, self.sample_size)[:self.sample_size]
+                merged_keys, merged_values = merged_keys[keep], merged_values[keep]
+            self.sample_keys[label] = merged_keys
+            self.sample_values[label] = merged_values
+        return self
+
+    def summary(self, variant):
+        i = self.index[variant]
+        n = int(self.n[i])
+        return {"n": n, "mean": float(self.mean[i]) if n else float('nan'),
+                "variance": float(self.m2[i] / (n - 1)) if n > 1 else float('nan'),
+                "conversions": int(self.conversions[i]),
+                "conversion_rate": self.conversions[i] / n if n else float('nan')}
+
+def ingest(path, variant_column='variant', value_column='value', chunk_size=CHUNK_SIZE, aggregates=None):
+    """Streams an event log (CSV or Parquet) into VariantAggregates chunk by chunk."""
+    aggregates = aggregates or VariantAggregates()
+    if str(path).endswith('.parquet'):
+        import pyarrow.parquet as pq
+        batches = (batch.to_pandas() for batch in
+                   pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=[variant_column, value_column]))
+    else:
+        batches = pd.read_csv(path, usecols=[variant_column, value_column], chunksize=chunk_size)
+    for chunk in batches:
+        aggregates.add(chunk[variant_column].to_numpy(), chunk[value_column].to_numpy(dtype=float))
+    return aggregates
+
+def sequential_test(a, b, tau=None):
+    """Mixture SPRT on the difference in means, giving an always-valid p-value.
+
+    Unlike the fixed-horizon Welch test it stays valid when the experiment is
+    checked repeatedly while events are still arriving. `tau` is the prior
+    scale of plausible effects; it defaults to the pooled standard deviation
+    scaled by 0.1.
+    """
+    diff = b["mean"] - a["mean"]
+    v = a["variance"] / a["n"] + b["variance"] / b["n"]
+    if tau is None:
+        tau = 0.1 * np.sqrt((a["variance"] + b["variance"]) / 2)
+    tau2 = tau * tau
+    if v == 0 or tau2 == 0:
+        return {"difference": diff, "always_valid_p": 0.0 if diff else 1.0, "welch_p": 0.0 if diff else 1.0}
+    log_lambda = 0.5 * np.log(v / (v + tau2)) + diff * diff * tau2 / (2 * v * (v + tau2))
+    return {
+        "difference": diff,
+        "always_valid_p": float(min(1.0, np.exp(-log_lambda))),
+        "welch_p": float(2 * stats.norm.sf(abs(diff) / np.sqrt(v))),
+    }
+
+def bayesian_test(a, b, draws=100_000, seed=None):
+    """Beta-Binomial on conversion rate and a normal posterior on the mean difference."""
+    rng = np.random.default_rng(seed)
+    rate_a = rng.beta(1 + a["conversions"], 1 + a["n"] - a["conversions"], draws)
+    rate_b = rng.beta(1 + b["conversions"], 1 + b["n"] - b["conversions"], draws)
+    v = a["variance"] / a["n"] + b["variance"] / b["n"]
+    diff = b["mean"] - a["mean"]
+    return {
+        "p_b_beats_a_conversion": float(np.mean(rate_b > rate_a)),
+        "expected_loss_b_conversion": float(np.mean(np.maximum(rate_a - rate_b, 0))),
+        "p_b_beats_a_mean": float(stats.norm.cdf(diff / np.sqrt(v))) if v else float(diff > 0),
+    }
+
+def bootstrap_ci(sample_a, a, sample_b, b, resamples=2000, alpha=0.05, block=20, seed=None):
+    """Percentile CI for the difference in means from vectorized resampling.
+
+    Resamples are drawn `block` at a time as one index matrix per variant.
+    When the sample is smaller than the full variant, deviations are scaled
+    by sqrt(m / n) and centred on the exact means, so the interval reflects
+    all n events.
+    """
+    rng = np.random.default_rng(seed)
+
+    def deviations(sample, n, count):
+        m = len(sample)
+        means = sample[rng.integers(0, m, size=(count, m))].mean(axis=1)
+        return (means - sample.mean()) * np.sqrt(m / n)
+
+    diffs = []
+    for start in range(0, resamples, block):
+        count = min(block, resamples - start)
+        diffs.append(b["mean"] - a["mean"] + deviations(sample_b, b["n"], count) - deviations(sample_a, a["n"], count))
+    low, high = np.percentile(np.concatenate(diffs), [100 * alpha / 2, 100 * (1 - alpha / 2)])
+    return float(low), float(high)
+
+def analyze(aggregates, control=None, resamples=2000, seed=None):
+    """Compares every variant against `control` (the first variant seen by default)."""
+    variants = aggregates.variants
+    if not variants:
+        raise ValueError("No events to analyze")
+    control = control or variants[0]
+    if control not in aggregates.index:
+        raise ValueError(f"Unknown control variant {control!r}")
+    base = aggregates.summary(control)
+    if base["n"] < 2:
+        raise ValueError(f"Control variant {control!r} needs at least 2 events, has {base['n']}")
+    results = {"control": control, "variants": {control: base}, "comparisons": {}}
+    for variant in variants:
+        if variant == control:
+            continue
+        treatment = aggregates.summary(variant)
+        results["variants"][variant] = treatment
+        if treatment["n"] < 2:
+            logging.warning(f"Skipping {variant!r}: only {treatment['n']} events")
+            continue
+        results["comparisons"][variant] = {
+            "sequential": sequential_test(base, treatment),
+            "bayesian": bayesian_test(base, treatment, seed=seed),
+            "bootstrap_ci": bootstrap_ci(aggregates.sample_values[control], base,
+                                         aggregates.sample_values[variant], treatment,
+                                         resamples=resamples, seed=seed),
+        }
+    return results
+
+def simulate_events(n, lift=0.02, seed=None):
+    # Revenue-like metric: ~10% of users convert, converters spend ~exp(3)
+    rng = np.random.default_rng(seed)
+    variants = np.where(rng.random(n) < 0.5, 'A', 'B')
+    converted = rng.random(n) < np.where(variants == 'B', 0.10 + lift, 0.10)
+    values = np.where(converted, rng.exponential(20.0, n), 0.0)
+    return variants, values
+
+def run_ab_test(events=1_000_000, chunk_size=CHUNK_SIZE, seed=None):
     try:
-        # Simulate A/B testing setup
-        group_a, group_b = [], []
-
-        for _ in range(100):
-            if random.random() > 0.5:
-                group_a.append(random.random())
-            else:
-                group_b.append(random.random())
-
-        # Analyze results
-        a_avg = sum(group_a) / len(group_a)
-        b_avg = sum(group_b) / len(group_b)
-        
-        logging.info(f'Group A Avg: {a_avg}, Group B Avg: {b_avg}')
+        aggregates = VariantAggregates(seed=seed)
+        variants, values = simulate_events(events, seed=seed)
+        for start in range(0, events, chunk_size):
+            aggregates.add(variants[start:start + chunk_size], values[start:start + chunk_size])
+        results = analyze(aggregates, control='A', seed=seed)
+        for variant, summary in results["variants"].items():
+            logging.info(f"Group {variant}: n={summary['n']} mean={summary['mean']:.4f} "
+                         f"conversion={summary['conversion_rate']:.4f}")
+        for variant, comparison in results["comparisons"].items():
+            logging.info(f"{variant} vs {results['control']}: {comparison}")
+        return results
     except Exception as e:
         logging.error(f"Error running A/B test: {e}")
 
-run_ab_test()
-```
\ No newline at end of file
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events-file', default=None, help='CSV or Parquet event log')
+    parser.add_argument('--variant-column', default='variant')
+    parser.add_argument('--value-column', default='value')
+    parser.add_argument('--control', default=None)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--simulate', type=int, default=1_000_000, help='simulated events when no file is given')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.events_file:
+        aggregates = ingest(args.events_file, args.variant_column, args.value_column, args.chunk_size)
+        ingested = time.perf_counter()
+        results = analyze(aggregates, control=args.control)
+        total = int(aggregates.n.sum())
+        logging.info(f"{total} events ingested in {ingested - start:.1f}s "
+                     f"({total / (ingested - start):.0f} events/s), analysis {time.perf_counter() - ingested:.1f}s")
+        logging.info(results)
+    else:
+        run_ab_test(args.simulate, args.chunk_size)
+        logging.info(f"{args.simulate} simulated events analyzed in {time.perf_counter() - start:.1f}s")
@@ -1,9 +1,96 @@
-```python
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import joblib
 import logging
+import os
+import threading
+
+MODEL_DIR = os.getenv('SKILL_GAP_MODEL_DIR', 'models/skill_gap')
+
+def data_fingerprint(df):
+    # Content hash of the training frame; identical data gives the same version
+    digest = hashlib.sha256(','.join(map(str, df.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    return digest.hexdigest()[:16]
+
+class SkillGapModel:
+    """Versioned skill-gap classifier, retrained only when the training data changes.
+
+    Each trained model is persisted as skill_gap_<fingerprint>.joblib, so a
+    restart or a repeat call with the same data loads it instead of fitting.
+    Training can run in the background; predict() keeps serving the current
+    version until the new one is ready.
+    """
+
+    def __init__(self, model_dir=MODEL_DIR, n_jobs=-1):
+        self.model_dir = model_dir
+        self.n_jobs = n_jobs
+        self.version = None
+        self.clf = None
+        self.features = None
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        os.makedirs(model_dir, exist_ok=True)
+        self.load_latest()
+
+    def model_path(self, version):
+        return os.path.join(self.model_dir, f'skill_gap_{version}.joblib')
+
+    def load_latest(self):
+        paths = [os.path.join(self.model_dir, name) for name in os.listdir(self.model_dir)
+                 if name.startswith('skill_gap_') and name.endswith('.joblib')]
+        if paths:
+            self.activate(*joblib.load(max(paths, key=os.path.getmtime)))
+
+    def activate(self, version, clf, features):
+        with self.lock:
+            self.version, self.clf, self.features = version, clf, features
+
+    def train(self, data):
+        df = pd.DataFrame(data)
+        version = data_fingerprint(df)
+        if version == self.version:
+            return version
+        if os.path.exists(self.model_path(version)):
+            self.activate(*joblib.load(self.model_path(version)))
+            return version
+
+        X = df.drop('skill_gap', axis=1)
+        y = df['skill_gap']
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+        clf = RandomForestClassifier(n_jobs=self.n_jobs, random_state=42)
+        clf.fit(X_train, y_train)
+        logging.info(f'Skill gap model {version} holdout accuracy: {accuracy_score(y_test, clf.predict(X_test))}')
+
+        features = list(X.columns)
+        joblib.dump((version, clf, features), self.model_path(version) + '.tmp')
+        os.replace(self.model_path(version) + '.tmp', self.model_path(version))
+        self.activate(version, clf, features)
+        return version
+
+    def train_async(self, data):
+        return self.executor.submit(self.train, data)
+
+    def predict(self, users):
+        """Predict skill gaps for any batch of users (records or a DataFrame)."""
+        with self.lock:
+            clf, features = self.clf, self.features
+        if clf is None:
+            raise RuntimeError("No skill gap model has been trained yet")
+        X = pd.DataFrame(users).reindex(columns=features)
+        return clf.predict(X)
+
+_model = None
+
+def get_model():
+    global _model
+    if _model is None:
+        _model = SkillGapModel()
+    return _model
 
 def analyze_skill_gap(data):
     try:
@@ -13,10 +100,9 @@ def analyze_skill_gap(data):
 
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
 
-        clf = RandomForestClassifier()
-        clf.fit(X_train, y_train)
-
-        predictions = clf.predict(X_test)
+        model = get_model()
+        model.train(data)
+        predictions = model.predict(X_test)
         accuracy = accuracy_score(y_test, predictions)
 
         logging.info(f'Skill gap analysis accuracy: {accuracy}')
@@ -24,4 +110,3 @@ def analyze_skill_gap(data):
     except Exception as e:
         logging.error(f"Error analyzing skill gap: {e}")
         raise
-```
\ No newline at end of file
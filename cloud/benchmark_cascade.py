@@ -0,0 +1,55 @@
+import argparse
+import time
+
+import numpy as np
+
+from cloud.ensemble_model import EnsembleModel
+
+# Compares the full ensemble against the early-exit cascade on a dataset.
+#   python -m cloud.benchmark_cascade xgb_model.json lstm_model.h5 data.npz --margins 0.1 0.2 0.3
+# data.npz holds `features` and, optionally, binary `labels`.
+
+
+def timed(fn, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def accuracy(scores, labels):
+    return float(np.mean((scores >= 0.5) == labels)) if labels is not None else float('nan')
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('xgb_model_path')
+    parser.add_argument('lstm_model_path')
+    parser.add_argument('dataset')
+    parser.add_argument('--margins', type=float, nargs='+', default=[0.05, 0.1, 0.2, 0.3])
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--timesteps', type=int, default=None, help='required for variable-length LSTMs')
+    args = parser.parse_args()
+
+    data = np.load(args.dataset)
+    features = data['features']
+    labels = data['labels'].astype(bool) if 'labels' in data else None
+
+    ensemble = EnsembleModel(args.xgb_model_path, args.lstm_model_path, timesteps=args.timesteps)
+    batch = ensemble.prepare(features)
+    ensemble.predict(batch)  # warm up both members
+
+    full_scores, full_time = timed(lambda: ensemble.predict(batch), args.repeats)
+    print(f"rows={len(batch)}")
+    print(f"{'mode':<16}{'rows/s':>12}{'speedup':>9}{'escalated':>11}{'agree':>8}{'accuracy':>10}")
+    print(f"{'full':<16}{len(batch) / full_time:>12.0f}{1.0:>9.2f}{1.0:>11.1%}{1.0:>8.1%}"
+          f"{accuracy(full_scores, labels):>10.4f}")
+
+    for margin in args.margins:
+        escalated = np.count_nonzero(np.abs(ensemble.predict_xgb(batch) - 0.5) < margin) / len(batch)
+        scores, cascade_time = timed(lambda: ensemble.predict_cascade(batch, margin=margin), args.repeats)
+        agree = np.mean((scores >= 0.5) == (full_scores >= 0.5))
+        print(f"{f'cascade@{margin:g}':<16}{len(batch) / cascade_time:>12.0f}{full_time / cascade_time:>9.2f}"
+              f"{escalated:>11.1%}{agree:>8.1%}{accuracy(scores, labels):>10.4f}")
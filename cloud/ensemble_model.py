@@ -1,23 +1,153 @@
-```python
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
 from xgboost import XGBClassifier
 import tensorflow as tf
 
+MEMBERS = ('xgb', 'lstm')
+
+class FeatureBatch:
+    """One batch of features with each member's input layout computed once."""
+
+    def __init__(self, features, timesteps):
+        self.features = np.ascontiguousarray(features, dtype=np.float32)
+        self.timesteps = timesteps
+        self._xgb = None
+        self._lstm = None
+
+    def __len__(self):
+        return len(self.features)
+
+    def subset(self, rows):
+        return FeatureBatch(self.features[rows], self.timesteps)
+
+    @property
+    def xgb_input(self):
+        if self._xgb is None:
+            self._xgb = self.features.reshape(len(self.features), -1)
+        return self._xgb
+
+    @property
+    def lstm_input(self):
+        if self._lstm is None:
+            self._lstm = self.features.reshape(len(self.features), self.timesteps, -1)
+        return self._lstm
+
 class EnsembleModel:
-    def __init__(self, xgb_model_path, lstm_model_path):
+    def __init__(self, xgb_model_path, lstm_model_path, weights=(0.5, 0.5), xgb_nthread=4,
+                 lstm_batch_size=256, latency_window=100, cascade_margin=0.2, timesteps=None):
         self.xgb_model = XGBClassifier()
         self.xgb_model.load_model(xgb_model_path)
-        
+        self.xgb_model.set_params(n_jobs=xgb_nthread)
+
         self.lstm_model = tf.keras.models.load_model(lstm_model_path)
+        self.lstm_batch_size = lstm_batch_size
+        input_shape = self.lstm_model.input_shape
+        model_timesteps = input_shape[1] if len(input_shape) == 3 else 1
+        if timesteps is not None and model_timesteps not in (None, timesteps):
+            raise ValueError(f"timesteps={timesteps} does not match the LSTM input length {model_timesteps}")
+        self.timesteps = timesteps or model_timesteps
+        if self.timesteps is None:
+            # Variable-length LSTMs leave the time axis unknown, so the flat
+            # feature rows cannot be reshaped without being told the length.
+            raise ValueError("LSTM has a variable-length time axis; pass timesteps= explicitly")
+
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.stacker = None
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.latency = {member: deque(maxlen=latency_window) for member in MEMBERS}
+        self.cascade_margin = cascade_margin
+        self.cascade_rows = 0
+        self.cascade_escalated = 0
+
+    def prepare(self, features):
+        return features if isinstance(features, FeatureBatch) else FeatureBatch(features, self.timesteps)
+
+    def predict_xgb(self, batch):
+        start = time.perf_counter()
+        scores = self.xgb_model.predict_proba(batch.xgb_input)[:, 1]
+        self.latency['xgb'].append(time.perf_counter() - start)
+        return scores
+
+    def predict_lstm(self, batch):
+        start = time.perf_counter()
+        scores = self.lstm_model.predict(batch.lstm_input, batch_size=self.lstm_batch_size, verbose=0)
+        self.latency['lstm'].append(time.perf_counter() - start)
+        # Align (n, 1) Keras output with XGBoost's (n,) probabilities.
+        return np.asarray(scores, dtype=np.float64).reshape(len(batch))
+
+    def member_scores(self, features, members=MEMBERS):
+        # XGBoost releases the GIL, so it runs on the executor while Keras
+        # scores the same batch on the calling thread.
+        batch = self.prepare(features)
+        scores = {}
+        xgb_future = self.executor.submit(self.predict_xgb, batch) if 'xgb' in members else None
+        if 'lstm' in members:
+            scores['lstm'] = self.predict_lstm(batch)
+        if xgb_future is not None:
+            scores['xgb'] = xgb_future.result()
+        return scores
+
+    def predict(self, features, members=MEMBERS):
+        """Ensemble probability per row.
+
+        Pass members=('xgb',) to drop the LSTM, e.g. when latency_stats()
+        shows it cannot keep up.
+        """
+        scores = self.member_scores(features, members)
+        if len(scores) == 1:
+            return next(iter(scores.values()))
+        return self.combine(scores['xgb'], scores['lstm'])
+
+    def predict_cascade(self, features, margin=None):
+        """Early-exit ensemble: XGBoost scores every row, and only rows whose
+        probability lies within `margin` of 0.5 are escalated to the LSTM and
+        combined as in predict(). Rows keep their input order.
+        """
+        margin = self.cascade_margin if margin is None else margin
+        batch = self.prepare(features)
+        scores = self.predict_xgb(batch)
+        uncertain = np.flatnonzero(np.abs(scores - 0.5) < margin)
+
+        self.cascade_rows += len(batch)
+        self.cascade_escalated += len(uncertain)
+        if len(uncertain):
+            lstm_scores = self.predict_lstm(batch.subset(uncertain))
+            scores = scores.copy()
+            scores[uncertain] = self.combine(scores[uncertain], lstm_scores)
+        return scores
+
+    def escalation_rate(self):
+        # Fraction of rows predict_cascade() has sent to the LSTM so far.
+        return self.cascade_escalated / self.cascade_rows if self.cascade_rows else 0.0
+
+    def combine(self, xgb_scores, lstm_scores):
+        stacked = np.column_stack([xgb_scores, lstm_scores])
+        if self.stacker is not None:
+            return self.stacker.predict_proba(stacked)[:, 1]
+        return stacked @ (self.weights / self.weights.sum())
+
+    def fit_stacker(self, features, labels):
+        # Learn the combination from held-out data instead of fixed weights.
+        scores = self.member_scores(features)
+        self.stacker = LogisticRegression()
+        self.stacker.fit(np.column_stack([scores['xgb'], scores['lstm']]), labels)
+        return self.stacker
 
-    def predict(self, features):
-        xgb_pred = self.xgb_model.predict(features)
-        lstm_pred = self.lstm_model.predict(features)
-        
-        # Simple ensemble strategy
-        final_prediction = (xgb_pred + lstm_pred) / 2
-        return final_prediction
+    def latency_stats(self):
+        stats = {}
+        for member, samples in self.latency.items():
+            if samples:
+                p50, p95 = np.percentile(samples, [50, 95]) * 1000
+                stats[member] = {"p50_ms": float(p50), "p95_ms": float(p95), "calls": len(samples)}
+        return stats
 
 # Example usage
-# ensemble = EnsembleModel('xgb_model.json', 'lstm_model.h5')
+# ensemble = EnsembleModel('xgb_model.json', 'lstm_model.h5', weights=(0.6, 0.4))
 # prediction = ensemble.predict(features)
-```
\ No newline at end of file
+# ensemble.latency_stats()
+# fast = ensemble.predict_cascade(features, margin=0.15)
+# ensemble.escalation_rate()
@@ -0,0 +1,76 @@
+import struct
+import zlib
+
+import numpy as np
+
+# Decoder for the binary telemetry format written by edge/telemetry_codec.py.
+# Records are read with a structured dtype in a single np.frombuffer call and
+# timestamps are rebuilt with a cumulative sum, so decoding cost is per batch
+# rather than per sample.
+
+MAGIC = b'ST'
+FLAG_ZLIB = 0x01
+HEADER = struct.Struct('<2sBBHIQ')
+
+# version -> schema_id -> [(field, dtype, scale)]
+SCHEMAS = {
+    1: {
+        1: [('temperature', '<i2', 100), ('humidity', '<u2', 100)],
+        2: [('acc_x', '<i2', 1), ('acc_y', '<i2', 1), ('acc_z', '<i2', 1),
+            ('temp', '<i2', 1),
+            ('gyro_x', '<i2', 1), ('gyro_y', '<i2', 1), ('gyro_z', '<i2', 1)],
+    },
+}
+
+
+def record_dtype(version, schema_id):
+    fields = SCHEMAS[version][schema_id]
+    return np.dtype([('delta_ms', '<u4')] + [(name, dtype) for name, dtype, _ in fields])
+
+
+def unwrap(payload):
+    # BatchPublisher compresses whole payloads by default (compress=True), so
+    # a frame may arrive inside an outer zlib stream rather than starting
+    # with MAGIC.
+    if bytes(payload[:2]) != MAGIC:
+        try:
+            return zlib.decompress(payload)
+        except zlib.error:
+            pass
+    return payload
+
+
+def read_header(payload):
+    magic, version, flags, schema_id, count, base_ms = HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise ValueError("not a telemetry payload")
+    if version not in SCHEMAS or schema_id not in SCHEMAS[version]:
+        raise ValueError(f"unsupported telemetry version {version} schema {schema_id}")
+    return version, flags, schema_id, count, base_ms
+
+
+def decode_batch(payload):
+    """Decode one payload into {'timestamp_ms': int64[n], field: float64[n], ...}."""
+    payload = unwrap(payload)
+    version, flags, schema_id, count, base_ms = read_header(payload)
+
+    body = memoryview(payload)[HEADER.size:]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+    records = np.frombuffer(body, dtype=record_dtype(version, schema_id), count=count)
+
+    columns = {'timestamp_ms': base_ms + np.cumsum(records['delta_ms'], dtype=np.int64)}
+    for name, _, scale in SCHEMAS[version][schema_id]:
+        columns[name] = records[name] / scale if scale != 1 else records[name].astype(np.float64)
+    return columns
+
+
+def decode_batches(payloads):
+    """Decode and concatenate payloads that share a schema into one column set."""
+    if not payloads:
+        return {}
+    schemas = {read_header(unwrap(payload))[0:3:2] for payload in payloads}
+    if len(schemas) != 1:
+        raise ValueError(f"payloads mix schemas {sorted(schemas)}")
+    decoded = [decode_batch(payload) for payload in payloads]
+    return {name: np.concatenate([batch[name] for batch in decoded]) for name in decoded[0]}
@@ -1,14 +1,56 @@
-```python
+import logging
+import queue
 import time
+from scheduler import AcquisitionScheduler
+import offline_storage
 from sensors import read_temperature_and_humidity
-from offline_storage import store_data
+
+STATS_INTERVAL = 300
+
+def deliver(sinks, name, timestamp, values):
+    # A failing sink (bad sample, full disk) loses this sample for that sink
+    # only; acquisition and the other sinks keep going.
+    for sink in sinks:
+        try:
+            sink(name, timestamp, values)
+        except Exception as e:
+            logging.error(f"Sink {getattr(sink, '__name__', sink)} failed for {name} sample at {timestamp}: {e}")
 
 def main():
-    while True:
-        temperature, humidity = read_temperature_and_humidity()
-        store_data(temperature, humidity)
-        time.sleep(60)
+    scheduler = AcquisitionScheduler()
+    # name -> (read function, period in seconds, runs on a worker thread)
+    sensors = {
+        'environment': (read_temperature_and_humidity, 60, True),
+    }
+    for name, (read, period, slow) in sensors.items():
+        scheduler.add_sensor(name, read, period, slow=slow)
+
+    # Extra consumers (e.g. an MQTT publisher) can be appended here; each
+    # receives (sensor_name, timestamp, values) for every sample.
+    sinks = [offline_storage.store_sample]
+
+    scheduler.start()
+    last_stats = time.monotonic()
+    try:
+        while True:
+            try:
+                name, timestamp, values = scheduler.samples.get(timeout=1)
+            except queue.Empty:
+                pass
+            else:
+                deliver(sinks, name, timestamp, values)
+
+            if time.monotonic() - last_stats >= STATS_INTERVAL:
+                logging.info(f"Acquisition stats: {scheduler.stats()}")
+                last_stats = time.monotonic()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        scheduler.stop()
+        while not scheduler.samples.empty():
+            deliver(sinks, *scheduler.samples.get_nowait())
+        offline_storage.close()
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     main()
-```
\ No newline at end of file
@@ -0,0 +1,37 @@
+import atexit
+import time
+
+from storage_engine import StorageEngine
+
+# One shared engine per sensor so repeated store calls are buffered into
+# segment files under sensor_data/<sensor> instead of reopening a text log per
+# sample. Buffered records are written out by close(), which also runs at
+# interpreter exit. `fields` is the sensor's record layout as
+# ((name, scale), ...), fixed by the first call for that sensor.
+ROOT = 'sensor_data'
+DEFAULT_FIELDS = (('temperature', 100), ('humidity', 100))
+engines = {}
+
+def engine_for(sensor, fields=None):
+    if sensor not in engines:
+        engines[sensor] = StorageEngine(f'{ROOT}/{sensor}', fields=fields or DEFAULT_FIELDS)
+    elif fields is not None and [name for name, _ in fields] != engines[sensor].fields:
+        raise ValueError(f"sensor {sensor!r} is already stored with fields {engines[sensor].fields}")
+    return engines[sensor]
+
+def store_sample(sensor, timestamp, values, fields=None):
+    engine_for(sensor, fields).append(timestamp, *values)
+
+def store_data(temperature, humidity, timestamp=None, sensor='environment'):
+    store_sample(sensor, time.time() if timestamp is None else timestamp, (temperature, humidity))
+
+def flush():
+    for engine in engines.values():
+        engine.flush()
+
+def close():
+    for engine in engines.values():
+        engine.close()
+    engines.clear()
+
+atexit.register(close)
@@ -0,0 +1,118 @@
+import heapq
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class SensorStats:
+    def __init__(self, window=256):
+        self.samples = 0
+        self.errors = 0
+        self.missed = 0
+        self.jitter = deque(maxlen=window)  # start - scheduled deadline, seconds
+
+    def snapshot(self):
+        jitter = sorted(self.jitter)
+        return {
+            "samples": self.samples,
+            "errors": self.errors,
+            "missed_deadlines": self.missed,
+            "jitter_mean_ms": sum(jitter) / len(jitter) * 1000 if jitter else None,
+            "jitter_p99_ms": jitter[int(0.99 * (len(jitter) - 1))] * 1000 if jitter else None,
+            "jitter_max_ms": jitter[-1] * 1000 if jitter else None,
+        }
+
+
+class Sensor:
+    def __init__(self, name, read, period, slow):
+        self.name = name
+        self.read = read
+        self.period = period
+        self.slow = slow
+        self.in_flight = None
+        self.stats = SensorStats()
+
+
+class AcquisitionScheduler:
+    """Samples several sensors at independent rates on monotonic deadlines.
+
+    Each sensor's next deadline is its previous deadline plus its period, so
+    read time and scheduling delay never accumulate as drift. Reads marked
+    `slow` run on a worker pool so they can't delay other sensors. Deadlines
+    that pass while a sensor is still busy or far behind are skipped and
+    counted as missed. Every sample is put on `samples` as
+    (sensor_name, wall_clock_timestamp, value).
+    """
+
+    def __init__(self, workers=2, queue_size=10000):
+        self.sensors = []
+        self.samples = queue.Queue(maxsize=queue_size)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def add_sensor(self, name, read, period, slow=False):
+        self.sensors.append(Sensor(name, read, period, slow))
+
+    def start(self):
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+        self.executor.shutdown(wait=True)
+
+    def stats(self):
+        return {sensor.name: sensor.stats.snapshot() for sensor in self.sensors}
+
+    def run(self):
+        start = time.monotonic()
+        deadlines = [(start, i) for i in range(len(self.sensors))]
+        heapq.heapify(deadlines)
+        while not self.stopped.is_set():
+            deadline, i = deadlines[0]
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self.stopped.wait(delay)
+                continue
+            sensor = self.sensors[i]
+            heapq.heapreplace(deadlines, (self.next_deadline(sensor, deadline), i))
+
+            if sensor.in_flight is not None and not sensor.in_flight.done():
+                sensor.stats.missed += 1
+                continue
+            sensor.stats.jitter.append(time.monotonic() - deadline)
+            if sensor.slow:
+                sensor.in_flight = self.executor.submit(self.sample, sensor)
+            else:
+                self.sample(sensor)
+
+    def next_deadline(self, sensor, deadline):
+        next_deadline = deadline + sensor.period
+        behind = time.monotonic() - next_deadline
+        if behind >= sensor.period:
+            # Run the latest due deadline late and skip the ones before it.
+            skipped = int(behind // sensor.period)
+            sensor.stats.missed += skipped
+            next_deadline += skipped * sensor.period
+        return next_deadline
+
+    def sample(self, sensor):
+        timestamp = time.time()
+        try:
+            value = sensor.read()
+        except Exception as e:
+            sensor.stats.errors += 1
+            logging.error(f"Reading {sensor.name} failed: {e}")
+            return
+        sensor.stats.samples += 1
+        try:
+            self.samples.put_nowait((sensor.name, timestamp, value))
+        except queue.Full:
+            logging.warning(f"Sample queue full, dropping {sensor.name} sample")
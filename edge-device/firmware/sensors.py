@@ -1,7 +1,5 @@
-```python
 def read_temperature_and_humidity():
     # Mock sensor reading
     temperature = 23.5  # Sensor reading code here
     humidity = 60.5     # Sensor reading code here
     return temperature, humidity
-```
\ No newline at end of file
@@ -0,0 +1,149 @@
+import logging
+import os
+import struct
+import time
+
+# Segment file layout (little-endian):
+#   header  magic 'SEG1' | field_count u16 | base_ts_ms u64
+#   records delta_ms u32 | one int32 per field, stored as round(value * scale)
+# delta_ms is relative to the segment's base_ts_ms, so a record for two
+# fields takes 12 bytes instead of a ~35 byte text line.
+
+MAGIC = b'SEG1'
+HEADER = struct.Struct('<4sHQ')
+SEGMENT_SUFFIX = '.seg'
+CURSOR_FILE = 'upload.cursor'
+
+
+class StorageEngine:
+    """Buffered, append-only sample storage split into rotating segment files.
+
+    Records are packed into an in-memory buffer and written to the active
+    segment in one append once `buffer_bytes` or `flush_interval` is reached,
+    instead of opening the file per sample. A segment is sealed once it
+    passes `segment_bytes` (or its delta would overflow) and the oldest
+    segments are deleted beyond `max_segments`. The upload cursor records the
+    last segment sent so replay() only returns unsent data.
+    """
+
+    def __init__(self, directory='sensor_data', fields=(('temperature', 100), ('humidity', 100)),
+                 buffer_bytes=4096, flush_interval=30.0, segment_bytes=1 << 20, max_segments=64, fsync=False):
+        self.directory = directory
+        self.fields = [name for name, _ in fields]
+        self.scales = [scale for _, scale in fields]
+        self.record = struct.Struct('<I' + 'i' * len(fields))
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self.segment_bytes = segment_bytes
+        self.max_segments = max_segments
+        self.fsync = fsync
+
+        self.buffer = bytearray()
+        self.last_flush = time.monotonic()
+        self.segment_file = None
+        self.segment_base_ms = None
+        self.segment_size = 0
+
+        os.makedirs(directory, exist_ok=True)
+        segments = self.segments()
+        # Never append to a segment left over from a previous run; its header
+        # may be from a different field layout and it may end in a torn write.
+        self.next_seq = segments[-1] + 1 if segments else 0
+
+    def append(self, timestamp, *values):
+        if len(values) != len(self.fields):
+            raise ValueError(f"expected {len(self.fields)} values ({', '.join(self.fields)}), got {len(values)}")
+        ts_ms = int(round(timestamp * 1000))
+        if self.segment_base_ms is None or not 0 <= ts_ms - self.segment_base_ms <= 0xFFFFFFFF:
+            self.flush()
+            self.open_segment(ts_ms)
+        self.buffer += self.record.pack(ts_ms - self.segment_base_ms,
+                                        *(int(round(v * s)) for v, s in zip(values, self.scales)))
+        if len(self.buffer) >= self.buffer_bytes or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        self.last_flush = time.monotonic()
+        if not self.buffer or self.segment_file is None:
+            return
+        self.segment_file.write(self.buffer)
+        self.segment_file.flush()
+        if self.fsync:
+            os.fsync(self.segment_file.fileno())
+        self.segment_size += len(self.buffer)
+        self.buffer = bytearray()
+        if self.segment_size >= self.segment_bytes:
+            self.seal_segment()
+
+    def close(self):
+        self.flush()
+        self.seal_segment()
+
+    def open_segment(self, base_ms):
+        self.seal_segment()
+        self.segment_base_ms = base_ms
+        self.segment_file = open(self.segment_path(self.next_seq), 'ab')
+        self.segment_file.write(HEADER.pack(MAGIC, len(self.fields), base_ms))
+        self.segment_size = HEADER.size
+        self.next_seq += 1
+        self.apply_retention()
+
+    def seal_segment(self):
+        if self.segment_file is not None:
+            self.segment_file.close()
+        self.segment_file = None
+        self.segment_base_ms = None
+
+    def apply_retention(self):
+        segments = self.segments()
+        for seq in segments[:max(0, len(segments) - self.max_segments)]:
+            if seq > self.upload_cursor():
+                logging.warning(f"Retention dropping unsent segment {seq}")
+            os.remove(self.segment_path(seq))
+
+    def segments(self):
+        return sorted(int(name[:-len(SEGMENT_SUFFIX)]) for name in os.listdir(self.directory)
+                      if name.endswith(SEGMENT_SUFFIX))
+
+    def segment_path(self, seq):
+        return os.path.join(self.directory, f"{seq:08d}{SEGMENT_SUFFIX}")
+
+    def upload_cursor(self):
+        try:
+            with open(os.path.join(self.directory, CURSOR_FILE)) as f:
+                return int(f.read())
+        except (FileNotFoundError, ValueError):
+            return -1
+
+    def mark_sent(self, seq):
+        path = os.path.join(self.directory, CURSOR_FILE)
+        with open(path + '.tmp', 'w') as f:
+            f.write(str(seq))
+        os.replace(path + '.tmp', path)
+
+    def read_segment(self, seq):
+        """Decode a segment into a list of (timestamp, value, ...) tuples."""
+        with open(self.segment_path(seq), 'rb') as f:
+            data = f.read()
+        magic, field_count, base_ms = HEADER.unpack_from(data)
+        if magic != MAGIC or field_count != len(self.fields):
+            raise ValueError(f"segment {seq} does not match this storage layout")
+        # Drop a torn trailing record from an interrupted write.
+        end = HEADER.size + (len(data) - HEADER.size) // self.record.size * self.record.size
+        return [((base_ms + delta) / 1000, *(v / s for v, s in zip(values, self.scales)))
+                for delta, *values in self.record.iter_unpack(memoryview(data)[HEADER.size:end])]
+
+    def replay(self, include_active=False):
+        """Yield (seq, records) for every sealed segment not yet marked sent.
+
+        With include_active the active segment is flushed and sealed first so
+        its records are replayed too. Call mark_sent(seq) after each
+        successful upload.
+        """
+        if include_active:
+            self.close()
+        cursor = self.upload_cursor()
+        active = self.next_seq - 1 if self.segment_file is not None else None
+        for seq in self.segments():
+            if seq > cursor and seq != active:
+                yield seq, self.read_segment(seq)
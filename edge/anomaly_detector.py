@@ -1,4 +1,5 @@
-```python
+import time
+
 import tflite_runtime.interpreter as tflite
 import numpy as np
 
@@ -6,19 +7,79 @@ class AnomalyDetector:
     def __init__(self, model_path):
         self.interpreter = tflite.Interpreter(model_path=model_path)
         self.interpreter.allocate_tensors()
+        self.input_index = self.interpreter.get_input_details()[0]['index']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
 
     def predict(self, input_data):
-        input_details = self.interpreter.get_input_details()
-        output_details = self.interpreter.get_output_details()
-
-        self.interpreter.set_tensor(input_details[0]['index'], input_data)
+        self.interpreter.set_tensor(self.input_index, input_data)
         self.interpreter.invoke()
-        predictions = self.interpreter.get_tensor(output_details[0]['index'])
-        
+        predictions = self.interpreter.get_tensor(self.output_index)
+
         # Simple anomaly detection logic
         return predictions > 0.5
 
+class StreamingAnomalyDetector:
+    """High-rate variant of AnomalyDetector with no per-sample allocation.
+
+    The input tensor is resized once to hold `batch_windows` windows and used
+    directly as a ring buffer: push() writes each window into its slot in the
+    interpreter's input buffer, and every full ring is scored with a single
+    invoke(). Outputs are thresholded from a view of the output tensor into a
+    preallocated result array, which is only valid until the next invoke.
+    """
+
+    def __init__(self, model_path, batch_windows=8, threshold=0.5, num_threads=1, latency_samples=1024):
+        self.interpreter = tflite.Interpreter(model_path=model_path, num_threads=num_threads)
+        input_details = self.interpreter.get_input_details()[0]
+        output_details = self.interpreter.get_output_details()[0]
+        self.window_shape = tuple(input_details['shape'][1:])
+        self.interpreter.resize_tensor_input(input_details['index'], (batch_windows,) + self.window_shape)
+        self.interpreter.allocate_tensors()
+
+        # tensor() returns a function producing a view over the interpreter's
+        # buffer; views must not be held across invoke(), the functions may.
+        self.input_view = self.interpreter.tensor(input_details['index'])
+        self.output_view = self.interpreter.tensor(output_details['index'])
+
+        self.batch_windows = batch_windows
+        self.threshold = threshold
+        self.slot = 0
+        self.results = np.empty(self.output_view().shape, dtype=bool)
+        self.latencies = np.zeros(latency_samples, dtype=np.int64)
+        self.invocations = 0
+
+    def push(self, window):
+        """Add one window; returns the anomaly flags when a ring is scored, else None."""
+        self.input_view()[self.slot] = window
+        self.slot += 1
+        if self.slot < self.batch_windows:
+            return None
+        self.slot = 0
+        return self.invoke()
+
+    def invoke(self):
+        start = time.perf_counter_ns()
+        self.interpreter.invoke()
+        np.greater(self.output_view(), self.threshold, out=self.results)
+        self.latencies[self.invocations % len(self.latencies)] = time.perf_counter_ns() - start
+        self.invocations += 1
+        return self.results
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)):
+        # Per-invoke latency in milliseconds over the most recent invocations.
+        recorded = self.latencies[:min(self.invocations, len(self.latencies))]
+        if not len(recorded):
+            return {}
+        values = np.percentile(recorded, percentiles) / 1e6
+        return {f"p{p}": float(v) for p, v in zip(percentiles, values)}
+
 # Usage example:
 # detector = AnomalyDetector("model.tflite")
 # result = detector.predict(np.array([[0.1, 0.2, 0.3]], dtype=np.float32))
-```
\ No newline at end of file
+#
+# stream = StreamingAnomalyDetector("model.tflite", batch_windows=16)
+# for window in windows:
+#     flags = stream.push(window)
+#     if flags is not None:
+#         handle(flags)
+# print(stream.latency_percentiles())
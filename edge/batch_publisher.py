@@ -0,0 +1,156 @@
+import json
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import deque
+
+
+def json_encoder(readings):
+    return json.dumps(readings, separators=(',', ':')).encode()
+
+
+class BatchPublisher:
+    """Buffers sensor readings and publishes them in batches.
+
+    Readings go into a bounded ring buffer (the oldest are dropped when it is
+    full). A background thread packs up to `batch_size` readings into one
+    payload whenever the buffer fills or `flush_interval` seconds pass. While
+    the client is offline, packed batches are written to `spool_dir` and
+    drained oldest-first at `drain_rate` batches/second once it reconnects;
+    new batches queue behind spooled ones so ordering is preserved.
+
+    `client` only needs paho's `publish(topic, payload, qos)` and
+    `is_connected()`.
+    """
+
+    def __init__(self, client, topic, batch_size=100, flush_interval=5.0, capacity=10000,
+                 spool_dir='mqtt_spool', drain_rate=10.0, qos=1, encoder=json_encoder, compress=True):
+        self.client = client
+        self.topic = topic
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.buffer = deque(maxlen=capacity)
+        self.spool_dir = spool_dir
+        self.drain_interval = 1.0 / drain_rate
+        self.qos = qos
+        self.encoder = encoder
+        self.compress = compress
+
+        self.cond = threading.Condition()
+        self.send_lock = threading.Lock()
+        self.stopped = False
+        self.last_drain = 0.0
+        self.dropped = 0
+        self.published_batches = 0
+        self.spooled_batches = 0
+
+        os.makedirs(spool_dir, exist_ok=True)
+        spooled = self.spool_files()
+        self.next_seq = int(spooled[-1].split('.')[0]) + 1 if spooled else 0
+
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def add(self, reading):
+        with self.cond:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append(reading)
+            if len(self.buffer) >= self.batch_size:
+                self.cond.notify()
+
+    def flush(self):
+        # Pack and send everything currently buffered.
+        while True:
+            batch = self.take_batch()
+            if not batch:
+                return
+            self.send(self.pack(batch))
+
+    def close(self):
+        with self.cond:
+            self.stopped = True
+            self.cond.notify()
+        self.thread.join()
+        self.flush()
+
+    def stats(self):
+        return {
+            "buffered": len(self.buffer),
+            "spooled": len(self.spool_files()),
+            "dropped": self.dropped,
+            "published_batches": self.published_batches,
+            "spooled_batches": self.spooled_batches,
+        }
+
+    def run(self):
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            with self.cond:
+                timeout = min(deadline - time.monotonic(), self.drain_interval)
+                if not self.stopped and len(self.buffer) < self.batch_size and timeout > 0:
+                    self.cond.wait(timeout)
+                if self.stopped:
+                    return
+                due = len(self.buffer) >= self.batch_size or time.monotonic() >= deadline
+            if due:
+                batch = self.take_batch()
+                if batch:
+                    self.send(self.pack(batch))
+                deadline = time.monotonic() + self.flush_interval
+            self.drain()
+
+    def take_batch(self):
+        with self.cond:
+            count = min(self.batch_size, len(self.buffer))
+            return [self.buffer.popleft() for _ in range(count)]
+
+    def pack(self, batch):
+        payload = self.encoder(batch)
+        return zlib.compress(payload) if self.compress else payload
+
+    def send(self, payload):
+        with self.send_lock:
+            if not self.spool_files() and self.publish(payload):
+                return
+            self.spool(payload)
+
+    def publish(self, payload):
+        if not self.client.is_connected():
+            return False
+        info = self.client.publish(self.topic, payload, qos=self.qos)
+        if info.rc != 0:
+            return False
+        self.published_batches += 1
+        return True
+
+    def drain(self):
+        # Send at most one spooled batch per drain_interval so a reconnect
+        # doesn't flood the link with the whole backlog at once.
+        now = time.monotonic()
+        if now - self.last_drain < self.drain_interval:
+            return
+        with self.send_lock:
+            files = self.spool_files()
+            if not files or not self.client.is_connected():
+                return
+            self.last_drain = now
+            path = os.path.join(self.spool_dir, files[0])
+            with open(path, 'rb') as f:
+                payload = f.read()
+            if self.publish(payload):
+                os.remove(path)
+
+    def spool(self, payload):
+        path = os.path.join(self.spool_dir, f"{self.next_seq:012d}.batch")
+        self.next_seq += 1
+        with open(path + '.tmp', 'wb') as f:
+            f.write(payload)
+        os.replace(path + '.tmp', path)
+        self.spooled_batches += 1
+        logging.info(f"MQTT offline, spooled batch to {path}")
+
+    def spool_files(self):
+        return sorted(name for name in os.listdir(self.spool_dir) if name.endswith('.batch'))
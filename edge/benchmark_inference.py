@@ -0,0 +1,82 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from edge.edge_inference import EdgeInference
+from edge.inference_runner import InferenceRunner
+
+# Sweeps interpreter thread counts and batch sizes for one model on the local CPU.
+#   python -m edge.benchmark_inference model.tflite --threads 1 2 4 --batch-sizes 1 4 16 64
+
+
+def random_input(interpreter, batch_size, rng):
+    shape = (batch_size,) + interpreter.input_shape[1:]
+    if np.issubdtype(interpreter.input_dtype, np.integer):
+        info = np.iinfo(interpreter.input_dtype)
+        return rng.integers(info.min, info.max, size=shape, dtype=interpreter.input_dtype)
+    return rng.random(shape).astype(interpreter.input_dtype)
+
+
+def bench_interpreter(model_path, num_threads, batch_size, duration):
+    # Raw single-interpreter throughput for one (threads, batch) point.
+    interpreter = EdgeInference(model_path, num_threads=num_threads)
+    inputs = random_input(interpreter, batch_size, np.random.default_rng(0))
+    interpreter.predict(inputs)  # warm up and settle the resized tensors
+
+    latencies = []
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        interpreter.predict(inputs)
+        latencies.append(time.perf_counter() - start)
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return len(latencies) * batch_size / sum(latencies), p50, p99
+
+
+def bench_runner(model_path, num_threads, replicas, max_batch, callers, duration):
+    # Throughput of single-sample requests from concurrent callers through the runner.
+    runner = InferenceRunner({"model": {"model_path": model_path, "num_threads": num_threads,
+                                        "replicas": replicas, "max_batch": max_batch}})
+    sample = random_input(runner.pools["model"].interpreters[0], 1, np.random.default_rng(0))
+    deadline = time.perf_counter() + duration
+
+    def caller():
+        done = 0
+        while time.perf_counter() < deadline:
+            runner.predict("model", sample)
+            done += 1
+        return done
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(callers) as executor:
+        total = sum(executor.map(lambda _: caller(), range(callers)))
+    elapsed = time.perf_counter() - start
+    runner.stop()
+    return total / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('model_path')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 4, 16, 64])
+    parser.add_argument('--replicas', type=int, default=2)
+    parser.add_argument('--callers', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=3.0)
+    args = parser.parse_args()
+
+    print(f"{'threads':>8}{'batch':>7}{'samples/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    for num_threads in args.threads:
+        for batch_size in args.batch_sizes:
+            throughput, p50, p99 = bench_interpreter(args.model_path, num_threads, batch_size, args.duration)
+            print(f"{num_threads:>8}{batch_size:>7}{throughput:>12.0f}{p50:>10.2f}{p99:>10.2f}")
+
+    print(f"\nrunner: {args.replicas} replicas, {args.callers} concurrent single-sample callers")
+    print(f"{'threads':>8}{'max_batch':>10}{'samples/s':>12}")
+    for num_threads in args.threads:
+        for max_batch in args.batch_sizes:
+            throughput = bench_runner(args.model_path, num_threads, args.replicas, max_batch,
+                                      args.callers, args.duration)
+            print(f"{num_threads:>8}{max_batch:>10}{throughput:>12.0f}")
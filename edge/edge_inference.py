@@ -1,22 +1,29 @@
-```python
 import tensorflow as tf
 import numpy as np
 
 class EdgeInference:
-    def __init__(self, model_path):
-        self.interpreter = tf.lite.Interpreter(model_path=model_path)
+    def __init__(self, model_path, num_threads=None):
+        self.interpreter = tf.lite.Interpreter(model_path=model_path, num_threads=num_threads)
         self.interpreter.allocate_tensors()
+        input_details = self.interpreter.get_input_details()[0]
+        self.input_index = input_details['index']
+        self.input_shape = tuple(input_details['shape'])
+        self.input_dtype = input_details['dtype']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
 
     def predict(self, input_data):
-        input_details = self.interpreter.get_input_details()
-        output_details = self.interpreter.get_output_details()
-        
-        self.interpreter.set_tensor(input_details[0]['index'], input_data)
+        # Resize the input tensor when the batch dimension changes so one
+        # invoke() can score several stacked inputs.
+        if tuple(input_data.shape) != self.input_shape:
+            self.interpreter.resize_tensor_input(self.input_index, input_data.shape)
+            self.interpreter.allocate_tensors()
+            self.input_shape = tuple(input_data.shape)
+
+        self.interpreter.set_tensor(self.input_index, input_data)
         self.interpreter.invoke()
-        output_data = self.interpreter.get_tensor(output_details[0]['index'])
+        output_data = self.interpreter.get_tensor(self.output_index)
         return output_data
 
 # Example usage
 # edge_inference = EdgeInference('model.tflite')
 # prediction = edge_inference.predict(np.array([input_data], dtype=np.float32))
-```
\ No newline at end of file
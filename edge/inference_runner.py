@@ -0,0 +1,114 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+
+from edge.edge_inference import EdgeInference
+
+
+class ModelPool:
+    """A pool of interpreters for one model, each driven by its own worker thread.
+
+    Workers pull requests from a shared queue and stack compatible ones (same
+    per-sample shape and dtype) into a single invoke of up to `max_batch`
+    samples, waiting at most `max_wait` seconds to fill a batch.
+    """
+
+    def __init__(self, name, model_path, replicas=1, num_threads=1, max_batch=16, max_wait=0.002):
+        self.name = name
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.requests = queue.Queue()
+        self.stopped = False
+        self.interpreters = [EdgeInference(model_path, num_threads=num_threads) for _ in range(replicas)]
+        self.workers = [threading.Thread(target=self.run, args=(interpreter,), daemon=True, name=f"{name}-{i}")
+                        for i, interpreter in enumerate(self.interpreters)]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, input_data):
+        if self.stopped:
+            raise RuntimeError(f"model pool {self.name} is stopped")
+        future = Future()
+        self.requests.put((input_data, future))
+        return future
+
+    def stop(self):
+        self.stopped = True
+        for _ in self.workers:
+            self.requests.put(None)
+        for worker in self.workers:
+            worker.join()
+
+    def run(self, interpreter):
+        deferred = deque()
+        while True:
+            first = deferred.popleft() if deferred else self.requests.get()
+            if first is None:
+                return
+            batch = [first]
+            key = (first[0].shape[1:], first[0].dtype)
+            rows = len(first[0])
+            deadline = time.monotonic() + self.max_wait
+            while rows < self.max_batch:
+                try:
+                    item = self.requests.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    # Finish this batch, then exit on the next loop.
+                    deferred.append(None)
+                    break
+                if (item[0].shape[1:], item[0].dtype) != key or rows + len(item[0]) > self.max_batch:
+                    deferred.append(item)
+                    break
+                batch.append(item)
+                rows += len(item[0])
+            self.execute(interpreter, batch)
+
+    def execute(self, interpreter, batch):
+        try:
+            inputs = batch[0][0] if len(batch) == 1 else np.concatenate([data for data, _ in batch])
+            outputs = interpreter.predict(inputs)
+        except Exception as e:
+            logging.error(f"Inference on {self.name} failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        offset = 0
+        for data, future in batch:
+            future.set_result(outputs[offset:offset + len(data)].copy())
+            offset += len(data)
+
+
+class InferenceRunner:
+    """Serves several TFLite models per device, each behind its own ModelPool.
+
+    `models` maps a model name to ModelPool keyword arguments, e.g.
+    {"anomaly": {"model_path": "anomaly.tflite", "replicas": 2, "num_threads": 1}}.
+    Inputs carry a leading batch dimension.
+    """
+
+    def __init__(self, models):
+        self.pools = {name: ModelPool(name, **options) for name, options in models.items()}
+
+    def submit(self, model, input_data):
+        return self.pools[model].submit(input_data)
+
+    def predict(self, model, input_data, timeout=None):
+        return self.submit(model, input_data).result(timeout)
+
+    def stop(self):
+        for pool in self.pools.values():
+            pool.stop()
+
+# Example usage
+# runner = InferenceRunner({
+#     "anomaly": {"model_path": "anomaly.tflite", "replicas": 2, "num_threads": 1},
+#     "forecast": {"model_path": "forecast.tflite", "num_threads": 2, "max_batch": 32},
+# })
+# flags = runner.predict("anomaly", np.array([window], dtype=np.float32))
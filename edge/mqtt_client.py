@@ -1,17 +1,27 @@
-```python
 import paho.mqtt.client as mqtt
 
+from edge.batch_publisher import BatchPublisher
+
 class MQTTClient:
     def __init__(self, broker_address, topic):
         self.client = mqtt.Client()
         self.broker_address = broker_address
         self.topic = topic
 
-    def connect(self):
-        self.client.connect(self.broker_address)
+    def connect(self, min_reconnect_delay=1, max_reconnect_delay=60):
+        # loop_start() runs paho's network thread, which reconnects with
+        # exponential backoff after a broker drop.
+        self.client.reconnect_delay_set(min_delay=min_reconnect_delay, max_delay=max_reconnect_delay)
+        self.client.connect_async(self.broker_address)
+        self.client.loop_start()
+
+    def publish(self, message, qos=0):
+        return self.client.publish(self.topic, message, qos=qos)
 
-    def publish(self, message):
-        self.client.publish(self.topic, message)
+    def batch_publisher(self, **kwargs):
+        # Buffered, batched publishing that survives broker outages;
+        # see BatchPublisher for the options.
+        return BatchPublisher(self.client, self.topic, **kwargs)
 
     def subscribe(self, on_message):
         self.client.on_message = on_message
@@ -22,4 +32,7 @@ class MQTTClient:
 # client = MQTTClient("mqtt_broker_address", "sensor/data")
 # client.connect()
 # client.publish("Sample message")
-```
\ No newline at end of file
+#
+# publisher = client.batch_publisher(batch_size=50, flush_interval=2.0)
+# publisher.add({"ts": time.time(), "temperature": 23.5})
+# publisher.close()
@@ -1,10 +1,24 @@
-```python
-import smbus
+import threading
 import time
 
+import numpy as np
+
+# MPU6050 registers
+PWR_MGMT_1 = 0x6B
+SMPLRT_DIV = 0x19
+CONFIG = 0x1A
+ACCEL_XOUT_H = 0x3B
+BURST_LENGTH = 14  # accel x/y/z, temperature, gyro x/y/z as big-endian int16
+GYRO_RATE_HZ = 1000  # gyro output rate with the DLPF enabled
+
+MPU6050_FIELDS = ('acc_x', 'acc_y', 'acc_z', 'temp', 'gyro_x', 'gyro_y', 'gyro_z')
+
 class SensorInterface:
-    def __init__(self, bus_number=1, mpu_address=0x68, mlx_address=0x5A):
-        self.bus = smbus.SMBus(bus_number)
+    def __init__(self, bus_number=1, mpu_address=0x68, mlx_address=0x5A, bus=None):
+        if bus is None:
+            import smbus
+            bus = smbus.SMBus(bus_number)
+        self.bus = bus
         self.mpu_address = mpu_address
         self.mlx_address = mlx_address
 
@@ -15,13 +29,124 @@ class SensorInterface:
         acc_z = self.bus.read_byte_data(self.mpu_address, 0x3F)
         return (acc_x, acc_y, acc_z)
 
+    def configure_mpu6050(self, sample_rate_hz=1000):
+        # Wake the device, enable the DLPF and set the internal sample rate so
+        # each burst read sees a fresh sample.
+        self.bus.write_byte_data(self.mpu_address, PWR_MGMT_1, 0x00)
+        self.bus.write_byte_data(self.mpu_address, CONFIG, 0x01)
+        divider = max(0, min(255, round(GYRO_RATE_HZ / sample_rate_hz) - 1))
+        self.bus.write_byte_data(self.mpu_address, SMPLRT_DIV, divider)
+
+    def read_mpu6050_burst(self, out=None):
+        # One I2C transaction for the whole 14-byte block, decoded as signed
+        # 16-bit values in MPU6050_FIELDS order.
+        block = self.bus.read_i2c_block_data(self.mpu_address, ACCEL_XOUT_H, BURST_LENGTH)
+        values = np.frombuffer(bytes(block), dtype='>i2')
+        if out is None:
+            return values.astype(np.int16)
+        out[:] = values
+        return out
+
     def read_mlx90614(self):
         # Read temperature data
         temp = self.bus.read_word_data(self.mlx_address, 0x07)
         return temp * 0.02 - 273.15
 
+class MPU6050Sampler:
+    """Burst-reads the MPU6050 at a target rate into a preallocated ring buffer.
+
+    Sample times come from monotonic deadlines rather than sleeping a fixed
+    period, so slow reads don't accumulate drift; deadlines that are already
+    past are counted in `missed` and skipped.
+    """
+
+    def __init__(self, sensor, rate_hz=1000, capacity=10000):
+        self.sensor = sensor
+        self.rate_hz = rate_hz
+        self.samples = np.zeros((capacity, len(MPU6050_FIELDS)), dtype=np.int16)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self.missed = 0
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.sensor.configure_mpu6050(self.rate_hz)
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread:
+            self.thread.join()
+
+    def run(self, max_samples=None):
+        period = 1.0 / self.rate_hz
+        capacity = len(self.samples)
+        next_deadline = time.monotonic()
+        taken = 0
+        while not self.stopped.is_set() and (max_samples is None or taken < max_samples):
+            now = time.monotonic()
+            if now < next_deadline:
+                time.sleep(next_deadline - now)
+            slot = self.count % capacity
+            self.sensor.read_mpu6050_burst(out=self.samples[slot])
+            self.timestamps[slot] = time.monotonic()
+            self.count += 1
+            taken += 1
+
+            next_deadline += period
+            now = time.monotonic()
+            if now > next_deadline + period:
+                skipped = int((now - next_deadline) / period)
+                self.missed += skipped
+                next_deadline += skipped * period
+
+    def latest(self, n=None):
+        # Copy of the most recent n samples (oldest first) and their timestamps.
+        capacity = len(self.samples)
+        available = min(self.count, capacity)
+        n = available if n is None else min(n, available)
+        index = (np.arange(self.count - n, self.count)) % capacity
+        return self.timestamps[index], self.samples[index]
+
+class SimulatedBus:
+    """smbus stand-in serving a synthetic MPU6050 vibration signal and MLX90614 reading."""
+
+    def __init__(self, vibration_hz=50.0, amplitude=4000, noise=50, seed=0):
+        self.vibration_hz = vibration_hz
+        self.amplitude = amplitude
+        self.noise = noise
+        self.rng = np.random.default_rng(seed)
+        self.registers = {}
+        self.block_reads = 0
+        self.start = time.monotonic()
+
+    def write_byte_data(self, address, register, value):
+        self.registers[(address, register)] = value
+
+    def read_byte_data(self, address, register):
+        block = self.read_i2c_block_data(address, ACCEL_XOUT_H, BURST_LENGTH)
+        return block[register - ACCEL_XOUT_H]
+
+    def read_word_data(self, address, register):
+        return int((25.0 + 273.15) / 0.02)
+
+    def read_i2c_block_data(self, address, register, length):
+        self.block_reads += 1
+        t = time.monotonic() - self.start
+        wave = self.amplitude * np.sin(2 * np.pi * self.vibration_hz * t)
+        values = np.array([wave, -wave, 16384, 0, wave / 2, 0, -wave / 2])
+        values += self.rng.normal(0, self.noise, len(values))
+        block = np.clip(values, -32768, 32767).astype('>i2').tobytes()
+        return list(block[register - ACCEL_XOUT_H:register - ACCEL_XOUT_H + length])
+
 # Example usage
 # sensor = SensorInterface()
 # acc_data = sensor.read_mpu6050()
 # temp = sensor.read_mlx90614()
-```
\ No newline at end of file
+#
+# sampler = MPU6050Sampler(SensorInterface(bus=SimulatedBus()), rate_hz=500)
+# sampler.start(); time.sleep(1); sampler.stop()
+# timestamps, samples = sampler.latest(256)
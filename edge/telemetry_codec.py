@@ -0,0 +1,66 @@
+import struct
+import zlib
+
+# Binary sensor telemetry, format version 1 (all little-endian):
+#
+#   header  magic 'ST' | version u8 | flags u8 | schema_id u16 | count u32 | base_ts_ms u64
+#   body    count fixed-width records: delta_ms u32 | one field per schema entry
+#
+# delta_ms is the gap to the previous sample (0 for the first, which sits at
+# base_ts_ms). Field values are stored as integers of value * scale. With
+# FLAG_ZLIB set the body is zlib-compressed. cloud/telemetry_decoder.py
+# mirrors this layout.
+
+MAGIC = b'ST'
+VERSION = 1
+FLAG_ZLIB = 0x01
+
+HEADER = struct.Struct('<2sBBHIQ')
+
+# schema_id -> [(field, struct code, scale)]
+SCHEMAS = {
+    1: [('temperature', 'h', 100), ('humidity', 'H', 100)],
+    2: [('acc_x', 'h', 1), ('acc_y', 'h', 1), ('acc_z', 'h', 1),
+        ('temp', 'h', 1),
+        ('gyro_x', 'h', 1), ('gyro_y', 'h', 1), ('gyro_z', 'h', 1)],
+}
+
+_records = {schema_id: struct.Struct('<I' + ''.join(code for _, code, _ in fields))
+            for schema_id, fields in SCHEMAS.items()}
+
+
+def encode_samples(schema_id, samples, compress=False):
+    """Encode [(timestamp_seconds, value, ...), ...] ordered by time.
+
+    Values follow the field order of SCHEMAS[schema_id].
+    """
+    fields = SCHEMAS[schema_id]
+    record = _records[schema_id]
+    scales = [scale for _, _, scale in fields]
+
+    body = bytearray(record.size * len(samples))
+    base_ms = int(round(samples[0][0] * 1000)) if samples else 0
+    previous_ms = base_ms
+    for i, (timestamp, *values) in enumerate(samples):
+        if len(values) != len(fields):
+            raise ValueError(f"schema {schema_id} expects {len(fields)} values, got {len(values)}")
+        ts_ms = int(round(timestamp * 1000))
+        try:
+            record.pack_into(body, i * record.size, ts_ms - previous_ms,
+                             *(int(round(value * scale)) for value, scale in zip(values, scales)))
+        except struct.error as e:
+            raise ValueError(f"sample {i} out of range for schema {schema_id}: {e}") from e
+        previous_ms = ts_ms
+
+    flags = 0
+    if compress:
+        body = zlib.compress(bytes(body))
+        flags |= FLAG_ZLIB
+    return HEADER.pack(MAGIC, VERSION, flags, schema_id, len(samples), base_ms) + bytes(body)
+
+
+def batch_encoder(schema_id, compress=False):
+    # Encoder for BatchPublisher(encoder=..., compress=False), whose readings
+    # are sample tuples. Use this function's compress flag instead of the
+    # publisher's; an outer zlib layer is still accepted by decode_batch.
+    return lambda samples: encode_samples(schema_id, samples, compress=compress)
@@ -1,33 +1,133 @@
-```python
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import json
+import os
+import time
+import uuid
 from QuantumSimulationEngine import QuantumSimulationEngine
 from ClassicalTradingEngine import ClassicalTradingEngine
 from StrategyOrchestrator import StrategyOrchestrator
+from QuantumAdvantageDetector import QuantumAdvantageDetector
+
+ADVANTAGE_CACHE_TTL = float(os.getenv('ADVANTAGE_CACHE_TTL', '5'))
+ADVANTAGE_CACHE_SIZE = int(os.getenv('ADVANTAGE_CACHE_SIZE', '10000'))
+TRAINING_WORKERS = int(os.getenv('TRAINING_WORKERS', '1'))
+TRAINING_JOB_TTL = float(os.getenv('TRAINING_JOB_TTL', '3600'))
+TRAINING_JOB_LIMIT = int(os.getenv('TRAINING_JOB_LIMIT', '1000'))
 
 app = FastAPI()
 strategy_orchestrator = StrategyOrchestrator()
+# Built once and reused across requests
+advantage_detector = QuantumAdvantageDetector()
+training_executor = ThreadPoolExecutor(max_workers=TRAINING_WORKERS)
+# job id -> (asyncio future, finished-at monotonic time or None)
+training_jobs = OrderedDict()
 
 class MarketData(BaseModel):
     features: list
     volatility: float
 
-@app.post("/train-quantum-model/")
+class AdvantageScoreCache:
+    """Short-TTL cache of advantage scores keyed by a hash of the market data.
+
+    Concurrent misses for the same key share one evaluation instead of each
+    running the detector.
+    """
+
+    def __init__(self, ttl=ADVANTAGE_CACHE_TTL, max_entries=ADVANTAGE_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.in_flight = {}
+
+    @staticmethod
+    def key(data: MarketData):
+        payload = json.dumps([data.features, data.volatility], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, data: MarketData, compute):
+        key = self.key(data)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        if key in self.in_flight:
+            return await asyncio.shield(self.in_flight[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        try:
+            score = await run_in_threadpool(compute, data)
+        except BaseException as e:
+            # BaseException so a cancelled request (CancelledError) still
+            # resolves the shared future instead of leaving waiters hanging.
+            if isinstance(e, asyncio.CancelledError):
+                future.set_exception(RuntimeError("advantage score evaluation was cancelled"))
+            else:
+                future.set_exception(e)
+            # Retrieve it so a failure nobody else awaited isn't logged as unhandled
+            future.exception()
+            raise
+        finally:
+            del self.in_flight[key]
+        future.set_result(score)
+        self.entries[key] = (time.monotonic() + self.ttl, score)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return score
+
+advantage_cache = AdvantageScoreCache()
+
+def evict_training_jobs():
+    # Finished jobs are kept for TRAINING_JOB_TTL seconds so clients can poll
+    # the result; beyond TRAINING_JOB_LIMIT the oldest finished ones go first.
+    now = time.monotonic()
+    finished = [job_id for job_id, (job, done_at) in training_jobs.items() if done_at is not None]
+    for job_id in finished:
+        if now - training_jobs[job_id][1] >= TRAINING_JOB_TTL:
+            del training_jobs[job_id]
+    for job_id in finished:
+        if len(training_jobs) <= TRAINING_JOB_LIMIT:
+            break
+        training_jobs.pop(job_id, None)
+
+def mark_finished(job_id, job):
+    if job_id in training_jobs:
+        training_jobs[job_id] = (job, time.monotonic())
+
+@app.post("/train-quantum-model/", status_code=202)
 async def train_quantum_model(data: MarketData):
-    try:
-        result = strategy_orchestrator.executeStrategy(data)
-        return {"result": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    # Training runs on a background executor; poll the returned job id
+    evict_training_jobs()
+    job_id = str(uuid.uuid4())
+    job = asyncio.wrap_future(training_executor.submit(strategy_orchestrator.executeStrategy, data))
+    training_jobs[job_id] = (job, None)
+    job.add_done_callback(lambda job: mark_finished(job_id, job))
+    return {"job_id": job_id, "status": "running"}
+
+@app.get("/train-quantum-model/{job_id}")
+async def get_training_job(job_id: str):
+    evict_training_jobs()
+    job, _ = training_jobs.get(job_id, (None, None))
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown training job")
+    if not job.done():
+        return {"job_id": job_id, "status": "running"}
+    if job.exception() is not None:
+        return {"job_id": job_id, "status": "failed", "error": str(job.exception())}
+    return {"job_id": job_id, "status": "completed", "result": job.result()}
 
 @app.get("/advantage-score/")
 async def get_advantage_score(data: MarketData):
     try:
-        detector = QuantumAdvantageDetector()
-        score = detector.evaluateMarketConditions(data)
+        score = await advantage_cache.get(data, advantage_detector.evaluateMarketConditions)
         return {"advantage_score": score}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Additional endpoints for strategy switching, simulation retrieval, and data preprocessing
-```
\ No newline at end of file
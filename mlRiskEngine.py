@@ -1,26 +1,163 @@
-```python
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
+from collections import OrderedDict
+from typing import List
+import joblib
 import logging
+import numpy as np
+import os
+import pandas as pd
+import psycopg2
+import psycopg2.pool
+import threading
+import time
 
 app = FastAPI()
 logging.basicConfig(level=logging.INFO)
 
+RISK_MODEL_PATH = os.getenv('RISK_MODEL_PATH', 'risk_model.pkl')
+BORROWER_FEATURES_PATH = os.getenv('BORROWER_FEATURES_PATH', 'borrower_features.parquet')
+BORROWER_FEATURE_TTL = float(os.getenv('BORROWER_FEATURE_TTL', '300'))
+BORROWER_CACHE_SIZE = int(os.getenv('BORROWER_CACHE_SIZE', '100000'))
+MAX_BATCH_SIZE = int(os.getenv('RISK_MAX_BATCH_SIZE', '50000'))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', '5'))
+
 class RiskAssessmentRequest(BaseModel):
     borrower_id: int
     loan_amount: float
     duration: int
 
+class BatchRiskAssessmentRequest(BaseModel):
+    loans: List[RiskAssessmentRequest]
+
+class BorrowerFeatureStore:
+    """Per-borrower feature vectors with a TTL cache in front of the source.
+
+    The source is the `borrower_features` table when DATABASE_URL is set,
+    otherwise the BORROWER_FEATURES_PATH parquet file loaded once. Misses for
+    a whole batch are fetched in one query over a connection pool kept for
+    the store's lifetime. Unknown borrowers are cached too (as NaN rows) with
+    the same TTL, so repeated lookups for them don't reach the database.
+    """
+
+    def __init__(self, ttl=BORROWER_FEATURE_TTL, max_entries=BORROWER_CACHE_SIZE):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.database_url = os.getenv('DATABASE_URL')
+        self.table = None
+        self.pool = None
+        if self.database_url:
+            self.pool = psycopg2.pool.ThreadedConnectionPool(1, DB_POOL_MAX_SIZE, self.database_url)
+        else:
+            self.table = pd.read_parquet(BORROWER_FEATURES_PATH).set_index('borrower_id')
+        self.columns = self.fetch_source([]).columns.tolist() if self.table is None else self.table.columns.tolist()
+
+    def fetch_source(self, borrower_ids):
+        if self.table is not None:
+            return self.table.reindex(borrower_ids).dropna(how='all')
+        conn = self.pool.getconn()
+        broken = False
+        try:
+            frame = pd.read_sql('SELECT * FROM borrower_features WHERE borrower_id = ANY(%(ids)s)',
+                                conn, params={'ids': list(borrower_ids)})
+            conn.rollback()
+        except Exception:
+            # Drop the connection rather than return one in an unknown state
+            broken = True
+            raise
+        finally:
+            self.pool.putconn(conn, close=broken)
+        return frame.set_index('borrower_id')
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.closeall()
+
+    def get(self, borrower_ids):
+        """Return an (n, n_features) array; rows for unknown borrowers are NaN."""
+        now = time.monotonic()
+        features = np.full((len(borrower_ids), len(self.columns)), np.nan)
+        missing = {}
+        with self.lock:
+            for i, borrower_id in enumerate(borrower_ids):
+                entry = self.cache.get(borrower_id)
+                if entry is not None and entry[0] > now:
+                    features[i] = entry[1]
+                else:
+                    missing.setdefault(borrower_id, []).append(i)
+
+        if missing:
+            fetched = self.fetch_source(list(missing))[self.columns]
+            rows = dict(zip(fetched.index, fetched.to_numpy(dtype=np.float64)))
+            unknown = np.full(len(self.columns), np.nan)
+            expires = now + self.ttl
+            with self.lock:
+                for borrower_id, positions in missing.items():
+                    row = rows.get(borrower_id, unknown)
+                    features[positions] = row
+                    self.cache[borrower_id] = (expires, row)
+                    self.cache.move_to_end(borrower_id)
+                while len(self.cache) > self.max_entries:
+                    self.cache.popitem(last=False)
+        return features
+
+class RiskScoringEngine:
+    def __init__(self):
+        # Model and feature lookups are loaded once per process
+        self.model = joblib.load(RISK_MODEL_PATH)
+        self.features = BorrowerFeatureStore()
+
+    def score(self, borrower_ids, loan_amounts, durations):
+        """Vectorized risk scores; NaN for borrowers without features."""
+        borrower_features = self.features.get(borrower_ids)
+        X = np.column_stack([borrower_features, loan_amounts, durations])
+        known = ~np.isnan(borrower_features).all(axis=1)
+        scores = np.full(len(X), np.nan)
+        if known.any():
+            scores[known] = self.model.predict_proba(X[known])[:, 1]
+        return scores
+
+engine = None
+
+@app.on_event("startup")
+async def load_engine():
+    global engine
+    engine = RiskScoringEngine()
+
+@app.on_event("shutdown")
+async def close_engine():
+    if engine is not None:
+        engine.features.close()
+
 @app.post("/assess-risk")
-async def assess_risk(request: RiskAssessmentRequest):
+def assess_risk(request: RiskAssessmentRequest):
     try:
         score = calculate_risk_score(request.borrower_id, request.loan_amount, request.duration)
-        return {"risk_score": score}
     except Exception as e:
         logging.error(f"Error assessing risk: {e}")
         raise HTTPException(status_code=500, detail="Internal Server Error")
+    if score is None:
+        raise HTTPException(status_code=404, detail=f"No features for borrower {request.borrower_id}")
+    return {"risk_score": score}
+
+@app.post("/assess-risk/batch")
+def assess_risk_batch(request: BatchRiskAssessmentRequest):
+    # Sync handler so FastAPI runs the vectorized pass in its threadpool.
+    if len(request.loans) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} loans per request")
+    try:
+        scores = engine.score(
+            [loan.borrower_id for loan in request.loans],
+            np.array([loan.loan_amount for loan in request.loans], dtype=np.float64),
+            np.array([loan.duration for loan in request.loans], dtype=np.float64),
+        )
+    except Exception as e:
+        logging.error(f"Error assessing batch risk: {e}")
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+    return {"risk_scores": [None if np.isnan(s) else float(s) for s in scores]}
 
 def calculate_risk_score(borrower_id, loan_amount, duration):
-    # Dummy implementation of risk calculation
-    return 0.5  # Placeholder for actual risk score logic
-```
\ No newline at end of file
+    score = engine.score([borrower_id], np.array([loan_amount]), np.array([duration]))[0]
+    return None if np.isnan(score) else float(score)
@@ -1,9 +1,19 @@
-```python
-from qiskit import QuantumCircuit, Aer, transpile, assemble
-from qiskit.visualization import plot_histogram
-from cirq import Circuit, X, measure, Simulator
+import argparse
+import hashlib
+import os
+import time
 
-def create_quantum_circuit():
+import cirq
+import numpy as np
+import sympy
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import ParameterVector
+from qiskit_aer import AerSimulator
+
+def headless():
+    return os.environ.get('MPLBACKEND', '').lower() == 'agg' or not (os.environ.get('DISPLAY') or os.name == 'nt')
+
+def create_quantum_circuit(plot=None):
     # Qiskit example
     qc = QuantumCircuit(2)
     qc.h(0)  # Apply Hadamard gate
@@ -11,25 +21,129 @@ def create_quantum_circuit():
     qc.measure_all()
 
     # Execute the circuit
-    simulator = Aer.get_backend('qasm_simulator')
+    simulator = AerSimulator()
     transpiled_circuit = transpile(qc, simulator)
-    qobj = assemble(transpiled_circuit)
-    result = simulator.run(qobj).result()
+    result = simulator.run(transpiled_circuit).result()
     counts = result.get_counts()
 
-    plot_histogram(counts)
+    if plot if plot is not None else not headless():
+        from qiskit.visualization import plot_histogram
+        plot_histogram(counts)
     return counts
 
 def cirq_example():
     # Cirq example
     qubit = cirq.LineQubit(0)
-    circuit = Circuit(X(qubit), measure(qubit, key='result'))
-    simulator = Simulator()
+    circuit = cirq.Circuit(cirq.X(qubit), cirq.measure(qubit, key='result'))
+    simulator = cirq.Simulator()
     result = simulator.run(circuit, repetitions=20)
     print(result)
     return result
 
+def climate_ansatz(num_qubits=4, layers=2):
+    # Hardware-efficient ansatz: RY/RZ rotations per qubit, linear CX entangler
+    theta = ParameterVector('theta', 2 * num_qubits * layers)
+    qc = QuantumCircuit(num_qubits)
+    k = 0
+    for _ in range(layers):
+        for q in range(num_qubits):
+            qc.ry(theta[k], q)
+            qc.rz(theta[k + 1], q)
+            k += 2
+        for q in range(num_qubits - 1):
+            qc.cx(q, q + 1)
+    qc.measure_all()
+    return qc
+
+def structure_hash(circuit):
+    # Gate sequence and wiring only; parameter values are left symbolic
+    digest = hashlib.sha256(f"{circuit.num_qubits}/{circuit.num_clbits}".encode())
+    for instruction in circuit.data:
+        digest.update(repr((
+            instruction.operation.name,
+            [str(param) for param in instruction.operation.params],
+            [circuit.find_bit(qubit).index for qubit in instruction.qubits],
+            [circuit.find_bit(clbit).index for clbit in instruction.clbits],
+        )).encode())
+    return digest.hexdigest()
+
+class SweepRunner:
+    """Transpiles each parameterized circuit once and runs parameter sweeps as one job.
+
+    Transpiled circuits are cached by structure_hash, so rerunning a sweep
+    (or a structurally identical circuit) skips transpilation. All bindings
+    of a sweep go to Aer as a single run() via parameter_binds.
+    """
+
+    def __init__(self, backend=None, optimization_level=1):
+        self.backend = backend or AerSimulator()
+        self.optimization_level = optimization_level
+        self.cache = {}
+
+    def transpiled(self, circuit):
+        key = structure_hash(circuit)
+        if key not in self.cache:
+            self.cache[key] = transpile(circuit, self.backend, optimization_level=self.optimization_level)
+        return self.cache[key]
+
+    def run_sweep(self, circuit, parameter_values, shots=1024):
+        """parameter_values: (n_points, n_parameters) array ordered like circuit.parameters."""
+        compiled = self.transpiled(circuit)
+        values = np.atleast_2d(np.asarray(parameter_values, dtype=float))
+        # A cache hit may come from another circuit with equal structure but
+        # distinct Parameter objects, so bind by name against the compiled
+        # circuit. Names are part of structure_hash, so they always match.
+        compiled_params = {param.name: param for param in compiled.parameters}
+        binds = {compiled_params[param.name]: values[:, i].tolist()
+                 for i, param in enumerate(circuit.parameters) if param.name in compiled_params}
+        result = self.backend.run(compiled, shots=shots, parameter_binds=[binds]).result()
+        return [result.get_counts(i) for i in range(len(values))]
+
+def cirq_sweep(values, repetitions=1024):
+    # Cirq equivalent: one symbolic circuit, all points in a single run_sweep call
+    qubit = cirq.LineQubit(0)
+    angle = sympy.Symbol('angle')
+    circuit = cirq.Circuit(cirq.ry(angle).on(qubit), cirq.measure(qubit, key='result'))
+    sweep = cirq.Points('angle', list(values))
+    return cirq.Simulator().run_sweep(circuit, params=sweep, repetitions=repetitions)
+
+def benchmark(points, num_qubits, layers, shots):
+    rng = np.random.default_rng(0)
+    circuit = climate_ansatz(num_qubits, layers)
+    values = rng.uniform(0, 2 * np.pi, size=(points, len(circuit.parameters)))
+    backend = AerSimulator()
+
+    # Previous pattern: rebuild, transpile and run one job per parameter point
+    start = time.perf_counter()
+    for row in values:
+        bound = climate_ansatz(num_qubits, layers).assign_parameters(row)
+        backend.run(transpile(bound, backend), shots=shots).result().get_counts()
+    naive = time.perf_counter() - start
+
+    runner = SweepRunner(backend)
+    start = time.perf_counter()
+    runner.run_sweep(circuit, values, shots=shots)
+    cold = time.perf_counter() - start
+    start = time.perf_counter()
+    runner.run_sweep(circuit, values, shots=shots)
+    warm = time.perf_counter() - start
+
+    print(f"{points} points, {num_qubits} qubits, {layers} layers, {shots} shots")
+    print(f"{'per-point transpile+run':<26}{naive:>8.2f}s")
+    print(f"{'batched, cold cache':<26}{cold:>8.2f}s  ({naive / cold:.1f}x)")
+    print(f"{'batched, cached transpile':<26}{warm:>8.2f}s  ({naive / warm:.1f}x)")
+
 if __name__ == "__main__":
-    create_quantum_circuit()
-    cirq_example()
-```
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--benchmark', action='store_true', help='run the parameter sweep benchmark')
+    parser.add_argument('--points', type=int, default=200)
+    parser.add_argument('--qubits', type=int, default=4)
+    parser.add_argument('--layers', type=int, default=2)
+    parser.add_argument('--shots', type=int, default=1024)
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.points, args.qubits, args.layers, args.shots)
+    else:
+        create_quantum_circuit()
+        cirq_example()
@@ -1,38 +1,290 @@
-```python
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sklearn.externals import joblib
-import psycopg2
+from typing import List
+import asyncio
+import asyncpg
+import csv
+import joblib
+import json
+import logging
+import numpy as np
 import os
+import pandas as pd
+import pyarrow.parquet as pq
+import time
 
 app = FastAPI()
 
-# Database connection
-db_conn = psycopg2.connect(os.getenv('NEON_POSTGRESQL_URL'))
+LOG_TABLE = 'ml_predictions'
+LOG_COLUMNS = ('feature1', 'feature2', 'prediction')
+LOG_BATCH_SIZE = int(os.getenv('PREDICTION_LOG_BATCH_SIZE', '500'))
+LOG_FLUSH_INTERVAL = float(os.getenv('PREDICTION_LOG_FLUSH_INTERVAL', '1.0'))
+LOG_MAX_PENDING = int(os.getenv('PREDICTION_LOG_MAX_PENDING', '50000'))
+LOG_SPILL_PATH = os.getenv('PREDICTION_LOG_SPILL_PATH', 'prediction_log_spill.csv')
+BULK_CHUNK_SIZE = int(os.getenv('BULK_CHUNK_SIZE', '10000'))
+FEATURES = ['feature1', 'feature2']
 
 # Load pre-trained ML model
 model = joblib.load('model.pkl')
 
+db_pool = None
+prediction_log = None
+
 class PredictionRequest(BaseModel):
     feature1: float
     feature2: float
 
+class BulkPredictionRequest(BaseModel):
+    feature1: List[float]
+    feature2: List[float]
+
+class PredictionLogBuffer:
+    """Write-behind buffer for prediction logs.
+
+    Rows are appended in memory and written with COPY in chunks of
+    `batch_size`, either when a chunk fills up or every `flush_interval`
+    seconds. Rows leave the buffer only after their COPY succeeds. If the
+    database stays down until `max_pending` rows are held, or at shutdown,
+    the buffer is spilled to disk and replayed once writes succeed again.
+    """
+
+    def __init__(self, pool, batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL,
+                 max_pending=LOG_MAX_PENDING, spill_path=LOG_SPILL_PATH):
+        self.pool = pool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.spill_path = spill_path
+        self.records = []
+        self.lock = asyncio.Lock()
+        self.wake = asyncio.Event()
+        self.closed = False
+        self.task = None
+        self.flushed_rows = 0
+        self.flush_count = 0
+        self.flush_failures = 0
+        self.spilled_rows = 0
+        self.last_flush_latency = None
+        self.max_flush_latency = 0.0
+
+    def start(self):
+        self.load_spill()
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+    def stats(self):
+        return {
+            "depth": len(self.records),
+            "flushed_rows": self.flushed_rows,
+            "flush_count": self.flush_count,
+            "flush_failures": self.flush_failures,
+            "spilled_rows": self.spilled_rows,
+            "last_flush_latency_ms": None if self.last_flush_latency is None else self.last_flush_latency * 1000,
+            "max_flush_latency_ms": self.max_flush_latency * 1000,
+        }
+
+    async def add(self, records):
+        if self.closed:
+            raise RuntimeError("prediction log is closed")
+        self.records.extend(records)
+        if len(self.records) >= self.batch_size:
+            self.wake.set()
+        if len(self.records) >= self.max_pending:
+            # Backpressure while the database lags; if it is down, spill to
+            # disk rather than failing a request whose row is already held.
+            try:
+                await self.flush()
+            except Exception as e:
+                async with self.lock:
+                    if len(self.records) >= self.max_pending:
+                        logging.error(f"Prediction log flush failed at {len(self.records)} pending rows: {e}")
+                        self.spill()
+
+    async def run(self):
+        while not self.closed:
+            try:
+                await asyncio.wait_for(self.wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logging.error(f"Prediction log flush failed, {len(self.records)} rows retained: {e}")
+                continue
+            if os.path.exists(self.spill_path) and not self.closed:
+                self.load_spill()
+                self.wake.set()
+
+    async def flush(self):
+        async with self.lock:
+            while self.records:
+                batch = self.records[:self.batch_size]
+                start = time.perf_counter()
+                try:
+                    async with self.pool.acquire() as conn:
+                        await conn.copy_records_to_table(LOG_TABLE, records=batch, columns=LOG_COLUMNS)
+                except Exception:
+                    self.flush_failures += 1
+                    raise
+                latency = time.perf_counter() - start
+                # New rows are only ever appended, so the head is still `batch`.
+                del self.records[:len(batch)]
+                self.flushed_rows += len(batch)
+                self.flush_count += 1
+                self.last_flush_latency = latency
+                self.max_flush_latency = max(self.max_flush_latency, latency)
+
+    async def close(self):
+        self.closed = True
+        self.wake.set()
+        if self.task:
+            await self.task
+        try:
+            await self.flush()
+        except Exception as e:
+            logging.error(f"Final prediction log flush failed: {e}")
+            self.spill()
+
+    def spill(self):
+        with open(self.spill_path, 'a', newline='') as file:
+            csv.writer(file).writerows(self.records)
+        self.spilled_rows += len(self.records)
+        logging.warning(f"Spilled {len(self.records)} prediction log rows to {self.spill_path}")
+        self.records = []
+
+    def load_spill(self):
+        # Replays at most max_pending rows; the rest stay on disk for the
+        # next successful flush.
+        if not os.path.exists(self.spill_path):
+            return
+        room = max(self.max_pending - len(self.records), 0)
+        rest_path = self.spill_path + '.rest'
+        loaded = 0
+        with open(self.spill_path, newline='') as file, open(rest_path, 'w', newline='') as rest:
+            writer = csv.writer(rest)
+            for row in csv.reader(file):
+                if not row:
+                    continue
+                if loaded < room:
+                    self.records.append(tuple(float(value) for value in row))
+                    loaded += 1
+                else:
+                    writer.writerow(row)
+        if os.path.getsize(rest_path):
+            os.replace(rest_path, self.spill_path)
+        else:
+            os.remove(rest_path)
+            os.remove(self.spill_path)
+        logging.info(f"Replaying {loaded} spilled prediction log rows")
+
+@app.on_event("startup")
+async def startup():
+    global db_pool, prediction_log
+    db_pool = await asyncpg.create_pool(
+        os.getenv('NEON_POSTGRESQL_URL'),
+        min_size=int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+        max_size=int(os.getenv('DB_POOL_MAX_SIZE', '5')),
+    )
+    prediction_log = PredictionLogBuffer(db_pool)
+    prediction_log.start()
+
+@app.on_event("shutdown")
+async def shutdown():
+    await prediction_log.close()
+    await db_pool.close()
+
 @app.post("/predict/")
 async def get_prediction(data: PredictionRequest):
     try:
         # Make prediction
-        prediction = model.predict([[data.feature1, data.feature2]])
-        
-        # Log prediction to database
-        cursor = db_conn.cursor()
-        cursor.execute('INSERT INTO ml_predictions (feature1, feature2, prediction) VALUES (%s, %s, %s)', 
-                       (data.feature1, data.feature2, prediction[0]))
-        db_conn.commit()
-
-        return {"prediction": prediction[0]}
+        prediction = float(model.predict([[data.feature1, data.feature2]])[0])
+
+        # Log prediction via the write-behind buffer
+        await prediction_log.add([(data.feature1, data.feature2, prediction)])
+
+        return {"prediction": prediction}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def score_chunk(features):
+    # features: (n, 2) float array -> NDJSON lines plus log rows for the chunk
+    predictions = model.predict(features)
+    records = list(zip(features[:, 0].tolist(), features[:, 1].tolist(), predictions.tolist()))
+    lines = ''.join(json.dumps({"feature1": f1, "feature2": f2, "prediction": p}) + '\n' for f1, f2, p in records)
+    return lines, records
+
+async def stream_predictions(chunks):
+    # `chunks` is a blocking iterator of (n, 2) arrays; read and score each one
+    # off the event loop so memory stays bounded by the chunk size and the
+    # log buffer's max_pending.
+    # The 200 status is already sent once streaming starts, so a failure
+    # mid-file (e.g. an unparseable row) ends the stream with an error line.
+    chunks = iter(chunks)
+    while True:
+        try:
+            features = await asyncio.to_thread(next, chunks, None)
+            if features is None:
+                break
+            lines, records = await asyncio.to_thread(score_chunk, features)
+        except Exception as e:
+            logging.error(f"Bulk prediction stream failed: {e}")
+            yield json.dumps({"error": str(e)}) + '\n'
+            break
+        await prediction_log.add(records)
+        yield lines
+
+def columnar_chunks(data: BulkPredictionRequest, chunk_size):
+    features = np.column_stack([data.feature1, data.feature2]).astype(np.float64)
+    for start in range(0, len(features), chunk_size):
+        yield features[start:start + chunk_size]
+
+def csv_chunks(file, chunk_size):
+    for frame in pd.read_csv(file, usecols=FEATURES, dtype=np.float64, chunksize=chunk_size):
+        yield frame[FEATURES].to_numpy()
+
+def upload_columns(file, parquet):
+    # Reads only the header/schema, then rewinds for the chunked reader.
+    columns = pq.ParquetFile(file).schema_arrow.names if parquet else pd.read_csv(file, nrows=0).columns
+    file.seek(0)
+    return list(columns)
+
+def parquet_chunks(file, chunk_size):
+    for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_size, columns=FEATURES):
+        yield np.column_stack([batch.column(name).to_numpy(zero_copy_only=False) for name in FEATURES]).astype(np.float64)
+
+@app.post("/predict/bulk")
+async def bulk_prediction(data: BulkPredictionRequest, chunk_size: int = Query(BULK_CHUNK_SIZE, gt=0)):
+    if len(data.feature1) != len(data.feature2):
+        raise HTTPException(status_code=400, detail="feature1 and feature2 must have the same length")
+    return StreamingResponse(stream_predictions(columnar_chunks(data, chunk_size)), media_type='application/x-ndjson')
+
+@app.post("/predict/bulk/upload")
+async def bulk_prediction_upload(file: UploadFile = File(...), chunk_size: int = Query(BULK_CHUNK_SIZE, gt=0)):
+    name = (file.filename or '').lower()
+    if name.endswith('.parquet') or file.content_type == 'application/vnd.apache.parquet':
+        parquet = True
+    elif name.endswith('.csv') or file.content_type == 'text/csv':
+        parquet = False
+    else:
+        raise HTTPException(status_code=400, detail="Upload a .csv or .parquet file")
+
+    # Validate before streaming so a bad upload gets a 400, not a cut-off 200.
+    try:
+        columns = await asyncio.to_thread(upload_columns, file.file, parquet)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Could not read upload: {e}")
+    missing = [name for name in FEATURES if name not in columns]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Upload is missing column(s): {', '.join(missing)}")
+
+    chunks = parquet_chunks(file.file, chunk_size) if parquet else csv_chunks(file.file, chunk_size)
+    return StreamingResponse(stream_predictions(chunks), media_type='application/x-ndjson')
+
+@app.get("/metrics/prediction-log")
+async def prediction_log_metrics():
+    return prediction_log.stats()
+
 if __name__ == '__main__':
     import uvicorn
-    uvicorn.run(app, host='0.0.0.0', port=8000)
\ No newline at end of file
+    uvicorn.run(app, host='0.0.0.0', port=8000)
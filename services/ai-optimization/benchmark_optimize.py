@@ -0,0 +1,76 @@
+import argparse
+import os
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import tensorflow as tf
+from sklearn.preprocessing import StandardScaler
+
+import main
+
+# Per-request latency of the old /optimize path (build a model and fit a
+# scaler on every call) against the resident model, single and batched.
+#   python benchmark_optimize.py --requests 200
+
+
+def legacy_predict(row):
+    model = tf.keras.Sequential([
+        tf.keras.layers.Dense(units=1, input_shape=[3])
+    ])
+    input_data = np.array([row])
+    scaler = StandardScaler()
+    input_data_scaled = scaler.fit_transform(input_data)
+    return model.predict(input_data_scaled, verbose=0)
+
+
+def measure(fn, inputs):
+    latencies = []
+    for item in inputs:
+        start = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - start)
+    return np.percentile(latencies, [50, 99]) * 1000, sum(latencies)
+
+
+def example_artifacts(directory, rng):
+    # Stand-in artifacts when no trained ones are given
+    readings = rng.normal([22, 60, 500], [3, 10, 150], size=(1000, 3)).astype(np.float32)
+    scaler = StandardScaler().fit(readings)
+    model = tf.keras.Sequential([tf.keras.layers.Dense(16, activation='relu', input_shape=[3]),
+                                 tf.keras.layers.Dense(1)])
+    model_path = os.path.join(directory, 'optimization_model.keras')
+    scaler_path = os.path.join(directory, 'optimization_scaler.joblib')
+    model.save(model_path)
+    joblib.dump(scaler, scaler_path)
+    return model_path, scaler_path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--model', default=None)
+    parser.add_argument('--scaler', default=None)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        model_path, scaler_path = (args.model, args.scaler) if args.model else example_artifacts(directory, rng)
+        main.model = tf.keras.models.load_model(model_path, compile=False)
+        main.scaler = joblib.load(scaler_path)
+
+    rows = rng.normal([22, 60, 500], [3, 10, 150], size=(args.requests, 3)).tolist()
+    main.predict(rows[:1])  # warm up
+
+    legacy_requests = max(1, args.requests // 10)  # each legacy call rebuilds a model
+    (l50, l99), _ = measure(legacy_predict, rows[:legacy_requests])
+    (r50, r99), _ = measure(lambda row: main.predict([row]), rows)
+    batches = [rows[i:i + args.batch_size] for i in range(0, len(rows), args.batch_size)]
+    (b50, b99), batch_total = measure(main.predict, batches)
+
+    print(f"{'path':<22}{'p50 ms':>10}{'p99 ms':>10}")
+    print(f"{'legacy per request':<22}{l50:>10.2f}{l99:>10.2f}")
+    print(f"{'resident per request':<22}{r50:>10.2f}{r99:>10.2f}")
+    print(f"{'resident batch':<22}{b50:>10.2f}{b99:>10.2f}  ({len(rows) / batch_total:.0f} readings/s)")
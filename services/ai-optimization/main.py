@@ -1,33 +1,54 @@
-```python
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
+from typing import List
+import joblib
+import os
 import tensorflow as tf
 import numpy as np
-from sklearn.preprocessing import StandardScaler
+
+MODEL_PATH = os.getenv('OPTIMIZATION_MODEL_PATH', 'optimization_model.keras')
+SCALER_PATH = os.getenv('OPTIMIZATION_SCALER_PATH', 'optimization_scaler.joblib')
 
 app = FastAPI()
 
+model = None
+scaler = None
+
 class OptimizationInput(BaseModel):
     temperature: float
     humidity: float
     light_intensity: float
 
+class BatchOptimizationInput(BaseModel):
+    readings: List[OptimizationInput]
+
+@app.on_event("startup")
+async def load_artifacts():
+    global model, scaler
+    # Trained model and the scaler fitted on its training data, loaded once
+    model = tf.keras.models.load_model(MODEL_PATH, compile=False)
+    scaler = joblib.load(SCALER_PATH)
+
+def predict(rows):
+    input_data = np.asarray(rows, dtype=np.float32).reshape(-1, 3)
+    input_data_scaled = scaler.transform(input_data).astype(np.float32)
+    return model(input_data_scaled, training=False).numpy()[:, 0]
+
 @app.post("/optimize")
 async def optimize_resources(data: OptimizationInput):
     try:
-        # Dummy model for demonstration
-        model = tf.keras.Sequential([
-            tf.keras.layers.Dense(units=1, input_shape=[3])
-        ])
-
-        # Dummy input data for prediction
-        input_data = np.array([[data.temperature, data.humidity, data.light_intensity]])
-        scaler = StandardScaler()
-        input_data_scaled = scaler.fit_transform(input_data)
-
-        # Predict optimization
-        prediction = model.predict(input_data_scaled)
-        return {"optimized_value": float(prediction[0][0])}
+        # Inference runs in a worker thread so the event loop stays free
+        prediction = await run_in_threadpool(predict, [[data.temperature, data.humidity, data.light_intensity]])
+        return {"optimized_value": float(prediction[0])}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/optimize/batch")
+async def optimize_resources_batch(data: BatchOptimizationInput):
+    try:
+        rows = [[r.temperature, r.humidity, r.light_intensity] for r in data.readings]
+        predictions = await run_in_threadpool(predict, rows)
+        return {"optimized_values": predictions.tolist()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-```
\ No newline at end of file
@@ -1,26 +1,199 @@
-```python
+import asyncio
+import json
 import logging
+import os
+import random
+import time
+from collections import deque
+
+import aiohttp
 import requests
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
 class TaskQueueConnector:
-    def __init__(self, queue_url):
+    def __init__(self, queue_url, timeout=10):
         self.queue_url = queue_url
+        self.timeout = timeout
+        self.session = requests.Session()
 
     def enqueue_task(self, task):
         try:
-            response = requests.post(self.queue_url, json=task)
+            response = self.session.post(self.queue_url, json=task, timeout=self.timeout)
             if response.status_code == 200:
                 logging.info("Task enqueued successfully")
-            else:
-                logging.error(f"Failed to enqueue task: {response.status_code}")
+                return True
+            logging.error(f"Failed to enqueue task: {response.status_code}")
         except Exception as e:
             logging.error(f"Error connecting to task queue: {e}")
+        return False
+
+class AsyncTaskQueueClient:
+    """Pooled asyncio client for the task queue.
+
+    enqueue_many() posts tasks in chunks of `batch_size` to `bulk_url`
+    ({"tasks": [...]}), with at most `pool_size` requests in flight. Failed
+    requests are retried with full-jitter exponential backoff; tasks that
+    still cannot be delivered are appended to `spill_path` (JSON lines) and
+    resent by drain_spill(), which also runs on start. Tasks the queue
+    rejects outright (4xx other than 429) are never retried: a rejected bulk
+    chunk is resent task by task, and tasks rejected on their own are
+    appended to `rejected_path` for inspection.
+    """
+
+    def __init__(self, queue_url, bulk_url=None, batch_size=100, pool_size=20, timeout=10,
+                 max_retries=5, backoff_base=0.2, backoff_cap=10.0, spill_path='task_queue_spill.jsonl',
+                 rejected_path='task_queue_rejected.jsonl'):
+        self.queue_url = queue_url
+        self.bulk_url = bulk_url or queue_url.rstrip('/') + '/bulk'
+        self.batch_size = batch_size
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.spill_path = spill_path
+        self.rejected_path = rejected_path
+        self.session = None
+        self.semaphore = asyncio.Semaphore(pool_size)
+        self.spill_lock = asyncio.Lock()
+        self.draining = False
+
+        self.started_at = None
+        self.enqueued = 0
+        self.spilled = 0
+        self.rejected = 0
+        self.retries = 0
+        self.latencies = deque(maxlen=1000)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        connector = aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        self.started_at = time.monotonic()
+        await self.drain_spill()
+
+    async def close(self):
+        await self.session.close()
+
+    async def enqueue(self, task):
+        return await self.enqueue_many([task])
+
+    async def enqueue_many(self, tasks):
+        """Returns the number of tasks accepted by the queue; the rest are spilled or rejected."""
+        chunks = [tasks[i:i + self.batch_size] for i in range(0, len(tasks), self.batch_size)]
+        results = await asyncio.gather(*(self.send_chunk(chunk) for chunk in chunks))
+        return sum(results)
+
+    async def send_chunk(self, tasks):
+        async with self.semaphore:
+            outcome = await self.post_with_retry(tasks)
+        if outcome == 'sent':
+            self.enqueued += len(tasks)
+            return len(tasks)
+        if outcome == 'rejected':
+            if len(tasks) > 1:
+                # Isolate the offending tasks instead of losing the whole chunk
+                return sum(await asyncio.gather(*(self.send_chunk([task]) for task in tasks)))
+            await self.reject(tasks)
+            return 0
+        await self.spill(tasks)
+        return 0
+
+    async def post_with_retry(self, tasks):
+        url, body = (self.queue_url, tasks[0]) if len(tasks) == 1 else (self.bulk_url, {"tasks": tasks})
+        for attempt in range(self.max_retries + 1):
+            start = time.monotonic()
+            try:
+                async with self.session.post(url, json=body) as response:
+                    if response.status < 300:
+                        self.latencies.append(time.monotonic() - start)
+                        return 'sent'
+                    if response.status not in RETRYABLE_STATUS:
+                        logging.warning(f"Task queue rejected {len(tasks)} tasks: {response.status}")
+                        return 'rejected'
+                    logging.warning(f"Task queue returned {response.status}, attempt {attempt + 1}")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logging.warning(f"Error connecting to task queue, attempt {attempt + 1}: {e}")
+            if attempt < self.max_retries:
+                self.retries += 1
+                await asyncio.sleep(random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt)))
+        return 'failed'
+
+    async def spill(self, tasks):
+        async with self.spill_lock:
+            with open(self.spill_path, 'a') as f:
+                f.writelines(json.dumps(task) + '\n' for task in tasks)
+        self.spilled += len(tasks)
+        logging.error(f"Task queue unavailable, spilled {len(tasks)} tasks to {self.spill_path}")
+
+    async def reject(self, tasks):
+        # Permanent failures: kept for inspection, never resent automatically.
+        async with self.spill_lock:
+            with open(self.rejected_path, 'a') as f:
+                f.writelines(json.dumps(task) + '\n' for task in tasks)
+        self.rejected += len(tasks)
+        logging.error(f"Task queue rejected {len(tasks)} tasks, written to {self.rejected_path}")
+
+    async def drain_spill(self):
+        # Resend spilled tasks. The file is moved aside first so tasks that
+        # fail again are re-spilled into a fresh file rather than duplicated.
+        # A .draining file left by a process that died mid-drain is resent
+        # too, with any newer spill appended to it.
+        if self.draining:
+            return 0
+        draining = self.spill_path + '.draining'
+        async with self.spill_lock:
+            if os.path.exists(draining):
+                if os.path.exists(self.spill_path):
+                    with open(self.spill_path) as src, open(draining, 'a') as dst:
+                        dst.write(src.read())
+                    os.remove(self.spill_path)
+            elif os.path.exists(self.spill_path):
+                os.replace(self.spill_path, draining)
+            else:
+                return 0
+            with open(draining) as f:
+                tasks = [json.loads(line) for line in f if line.strip()]
+            self.draining = True
+        try:
+            sent = await self.enqueue_many(tasks)
+        finally:
+            self.draining = False
+        os.remove(draining)
+        logging.info(f"Drained {sent}/{len(tasks)} spilled tasks")
+        return sent
+
+    def stats(self):
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0
+        latency = sorted(self.latencies)
+        return {
+            "enqueued": self.enqueued,
+            "spilled": self.spilled,
+            "rejected": self.rejected,
+            "retries": self.retries,
+            "throughput_per_sec": self.enqueued / elapsed if elapsed else 0.0,
+            "latency_p50_ms": latency[len(latency) // 2] * 1000 if latency else None,
+            "latency_p99_ms": latency[int(0.99 * (len(latency) - 1))] * 1000 if latency else None,
+        }
 
 # Example usage
 if __name__ == "__main__":
     connector = TaskQueueConnector("http://execution-queue")
     connector.enqueue_task({"type": "analyze_data", "data": {"user_id": 1}})
-```
\ No newline at end of file
+
+    async def bulk_example():
+        async with AsyncTaskQueueClient("http://execution-queue") as client:
+            await client.enqueue_many([{"type": "analyze_data", "data": {"user_id": i}} for i in range(1000)])
+            logging.info(f"Enqueue stats: {client.stats()}")
+
+    asyncio.run(bulk_example())
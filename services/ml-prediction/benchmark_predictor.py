@@ -0,0 +1,68 @@
+import argparse
+import asyncio
+import time
+
+import httpx
+import numpy as np
+
+# Usage: start predictor.py, then
+#   python benchmark_predictor.py --url http://localhost:8000 --concurrency 1 8 32 128
+
+async def single_request(client, url, rng):
+    response = await client.post(f"{url}/predict", params={"input_data": float(rng.random())})
+    response.raise_for_status()
+    return 1
+
+async def batch_request(client, url, rng, batch_size):
+    body = rng.random(batch_size).astype('<f8').tobytes()
+    response = await client.post(
+        f"{url}/predict/batch",
+        content=body,
+        headers={"content-type": "application/octet-stream", "accept": "application/octet-stream"},
+    )
+    response.raise_for_status()
+    return batch_size
+
+async def run_level(url, concurrency, duration, batch_size):
+    rng = np.random.default_rng(0)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    requests_done = 0
+    rows_done = 0
+    latencies = []
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def worker():
+            nonlocal requests_done, rows_done
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                if batch_size:
+                    rows = await batch_request(client, url, rng, batch_size)
+                else:
+                    rows = await single_request(client, url, rng)
+                latencies.append(time.perf_counter() - start)
+                requests_done += 1
+                rows_done += rows
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return requests_done / elapsed, rows_done / elapsed, p50, p99
+
+async def main(args):
+    modes = [("single", 0)] + [(f"batch[{size}]", size) for size in args.batch_sizes]
+    print(f"{'mode':<14}{'conc':>6}{'req/s':>12}{'rows/s':>14}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, batch_size in modes:
+        for concurrency in args.concurrency:
+            rps, rows, p50, p99 = await run_level(args.url, concurrency, args.duration, batch_size)
+            print(f"{name:<14}{concurrency:>6}{rps:>12.0f}{rows:>14.0f}{p50:>10.2f}{p99:>10.2f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default='http://localhost:8000')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 128])
+    parser.add_argument('--batch-sizes', type=int, nargs='*', default=[1024])
+    parser.add_argument('--duration', type=float, default=5.0)
+    asyncio.run(main(parser.parse_args()))
@@ -1,23 +1,127 @@
-```python
+import asyncio
+import os
+import sys
+
+import joblib
 import numpy as np
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
 from sklearn.linear_model import LinearRegression
 import uvicorn
 
 app = FastAPI()
 
-# Example model and data
-model = LinearRegression()
-# Dummy data for example purposes
-X = np.array([[1], [2], [3]])
-y = np.array([1, 2, 3])
-model.fit(X, y)
+MODEL_PATH = os.getenv('MODEL_PATH', 'model.pkl')
+MAX_BATCH_SIZE = int(os.getenv('PREDICT_MAX_BATCH_SIZE', '256'))
+MAX_BATCH_WAIT = float(os.getenv('PREDICT_MAX_BATCH_WAIT_MS', '2')) / 1000
+
+BINARY_DTYPES = {'float32': np.float32, 'float64': np.float64}
+
+model = None
+batcher = None
+
+def fit_example_model(path=MODEL_PATH):
+    # Dummy data for example purposes; writes the artifact the service loads
+    X = np.array([[1], [2], [3]])
+    y = np.array([1, 2, 3])
+    example = LinearRegression()
+    example.fit(X, y)
+    joblib.dump(example, path)
+    return example
+
+def predict_array(values):
+    X = np.asarray(values, dtype=np.float64).reshape(-1, model.n_features_in_)
+    return model.predict(X)
+
+class MicroBatcher:
+    """Merges concurrent single-row requests into one predict_array call.
+
+    The first queued request opens a window of `max_wait` seconds; everything
+    that arrives in that window (up to `max_batch_size`) is scored together.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=MAX_BATCH_SIZE, max_wait=MAX_BATCH_WAIT):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, value):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((value, future))
+        return await future
+
+    async def run(self):
+        while True:
+            batch = [await self.queue.get()]
+            if self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            try:
+                predictions = self.predict_fn([value for value, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), prediction in zip(batch, predictions):
+                if not future.done():
+                    future.set_result(float(prediction))
+
+@app.on_event("startup")
+async def load_model():
+    global model, batcher
+    # Load once from the serialized artifact instead of fitting at import
+    model = joblib.load(MODEL_PATH)
+    batcher = MicroBatcher(predict_array)
+    batcher.start()
+
+@app.on_event("shutdown")
+async def stop_batcher():
+    if batcher:
+        await batcher.stop()
 
 @app.post("/predict")
 async def predict(input_data: float):
-    prediction = model.predict(np.array([[input_data]]))
-    return {"prediction": prediction[0]}
+    prediction = await batcher.submit(input_data)
+    return {"prediction": prediction}
+
+@app.post("/predict/batch")
+async def predict_batch(request: Request):
+    # Accepts {"inputs": [...]} JSON, or a raw little-endian array with
+    # Content-Type: application/octet-stream (dtype via X-Dtype, default float64).
+    content_type = request.headers.get('content-type', '')
+    try:
+        if content_type.startswith('application/octet-stream'):
+            dtype = BINARY_DTYPES.get(request.headers.get('x-dtype', 'float64'))
+            if dtype is None:
+                raise ValueError(f"X-Dtype must be one of {sorted(BINARY_DTYPES)}")
+            values = np.frombuffer(await request.body(), dtype=np.dtype(dtype).newbyteorder('<'))
+        else:
+            values = (await request.json())['inputs']
+        predictions = await asyncio.to_thread(predict_array, values)
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if 'application/octet-stream' in request.headers.get('accept', ''):
+        return Response(content=predictions.astype('<f8').tobytes(), media_type='application/octet-stream')
+    return {"predictions": predictions.tolist()}
 
 if __name__ == "__main__":
+    if '--fit-example' in sys.argv:
+        fit_example_model()
     uvicorn.run(app, host="0.0.0.0", port=8000)
-```
\ No newline at end of file
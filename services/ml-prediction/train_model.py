@@ -1,39 +1,216 @@
-```python
-import pika
+import argparse
+import functools
 import json
+import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import pika
 from sklearn.linear_model import LinearRegression
 import numpy as np
 
+logging.basicConfig(level=logging.INFO)
+
+QUEUE = os.getenv('ML_TRAINING_QUEUE', 'ml_training_data')
+RESULT_QUEUE = os.getenv('ML_RESULT_QUEUE', 'ml_training_results')
+
 def train_and_predict(data):
     # Example: Training a simple linear regression model
     X = np.array(data['features'])
     y = np.array(data['targets'])
-    
+
     model = LinearRegression()
     model.fit(X, y)
-    
+
     predictions = model.predict(X)
     return predictions.tolist()
 
+def schema_key(data):
+    # Messages whose design matrices and targets have the same shape can be
+    # solved together as one stacked least-squares problem.
+    # Anything LinearRegression would reject raises ValueError here so the
+    # worker can answer it immediately instead of failing in the pool.
+    X = np.asarray(data['features'], dtype=float)
+    y = np.asarray(data['targets'], dtype=float)
+    if X.ndim != 2:
+        raise ValueError(f"features must be a 2-D array, got {X.ndim} dimension(s)")
+    if 0 in X.shape:
+        raise ValueError(f"features must have at least one row and column, got shape {X.shape}")
+    if y.ndim not in (1, 2) or y.shape[0] != X.shape[0]:
+        raise ValueError(f"targets shape {y.shape} does not match {X.shape[0]} feature rows")
+    if not (np.isfinite(X).all() and np.isfinite(y).all()):
+        raise ValueError("features and targets must be finite (no NaN or inf)")
+    return X.shape, y.shape
+
+def train_and_predict_batch(batch):
+    # Vectorized equivalent of train_and_predict over a list of messages that
+    # share a schema_key: fit ordinary least squares with an intercept for
+    # every message at once via a stacked pseudo-inverse.
+    X = np.asarray([data['features'] for data in batch], dtype=float)
+    y = np.asarray([data['targets'] for data in batch], dtype=float)
+    squeeze = y.ndim == 2
+    if squeeze:
+        y = y[..., np.newaxis]
+
+    X_mean = X.mean(axis=1, keepdims=True)
+    y_mean = y.mean(axis=1, keepdims=True)
+    coef = np.linalg.pinv(X - X_mean) @ (y - y_mean)
+    predictions = (X - X_mean) @ coef + y_mean
+
+    if squeeze:
+        predictions = predictions[..., 0]
+    return predictions.tolist()
+
+def train_and_predict_each(batch):
+    # Fallback when a stacked fit fails: fit messages one by one so a single
+    # bad message only costs its own result.
+    results = []
+    for data in batch:
+        try:
+            results.append({"predictions": train_and_predict(data)})
+        except Exception as e:
+            results.append({"error": str(e)})
+    return results
+
 def callback(ch, method, properties, body):
     message = json.loads(body)
     predictions = train_and_predict(message)
-    
+
     print("Predictions:", predictions)
-    
+
     # Here you would normally send the predictions back to a service or store them in a database
 
 def start():
     connection = pika.BlockingConnection(pika.ConnectionParameters('localhost'))
     channel = connection.channel()
     queue = 'ml_training_data'
-    
+
     channel.queue_declare(queue=queue, durable=True)
     channel.basic_consume(queue=queue, on_message_callback=callback, auto_ack=True)
-    
+
     print('Waiting for messages in', queue)
     channel.start_consuming()
 
+class TrainingWorker:
+    """Durable consumer: messages are acked only once their result is published.
+
+    Up to `prefetch` unacked deliveries are buffered, grouped by schema_key and
+    fitted in a process pool; a group of compatible messages becomes a single
+    train_and_predict_batch call.
+    """
+
+    def __init__(self, host='localhost', queue=QUEUE, result_queue=RESULT_QUEUE,
+                 prefetch=32, processes=None, flush_interval=0.05):
+        self.host = host
+        self.queue = queue
+        self.result_queue = result_queue
+        self.prefetch = prefetch
+        self.processes = processes or os.cpu_count()
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.in_flight = 0
+        self.flush_scheduled = False
+
+    def run(self):
+        self.connection = pika.BlockingConnection(pika.ConnectionParameters(self.host))
+        self.channel = self.connection.channel()
+        self.channel.queue_declare(queue=self.queue, durable=True)
+        self.channel.queue_declare(queue=self.result_queue, durable=True)
+        self.channel.basic_qos(prefetch_count=self.prefetch)
+        self.channel.basic_consume(queue=self.queue, on_message_callback=self.on_message, auto_ack=False)
+
+        with ProcessPoolExecutor(max_workers=self.processes) as pool:
+            self.pool = pool
+            logging.info(f"Worker consuming {self.queue} (prefetch={self.prefetch}, processes={self.processes})")
+            try:
+                self.channel.start_consuming()
+            except KeyboardInterrupt:
+                self.channel.stop_consuming()
+            finally:
+                # Unacked deliveries are redelivered by the broker once the
+                # connection closes, so nothing buffered here is lost.
+                self.connection.close()
+
+    def on_message(self, ch, method, properties, body):
+        try:
+            message = json.loads(body)
+            key = schema_key(message)
+        except (ValueError, KeyError, TypeError) as e:
+            logging.error(f"Rejecting malformed training message: {e}")
+            self.publish_result(properties, {"error": str(e)})
+            ch.basic_ack(delivery_tag=method.delivery_tag)
+            return
+
+        self.pending.append((key, message, method, properties))
+        if len(self.pending) + self.in_flight >= self.prefetch:
+            self.flush()
+        elif not self.flush_scheduled:
+            self.flush_scheduled = True
+            self.connection.call_later(self.flush_interval, self.flush)
+
+    def flush(self):
+        self.flush_scheduled = False
+        groups = defaultdict(list)
+        for key, message, method, properties in self.pending:
+            groups[key].append((message, method, properties))
+        self.pending = []
+
+        for items in groups.values():
+            self.submit(items, train_and_predict_batch)
+
+    def submit(self, items, fn):
+        future = self.pool.submit(fn, [message for message, _, _ in items])
+        self.in_flight += len(items)
+        future.add_done_callback(
+            lambda f: self.connection.add_callback_threadsafe(
+                functools.partial(self.complete, items, f, fn)))
+
+    def complete(self, items, future, fn):
+        self.in_flight -= len(items)
+        try:
+            results = future.result()
+        except Exception as e:
+            if fn is train_and_predict_batch:
+                logging.error(f"Stacked fit of {len(items)} messages failed, fitting individually: {e}")
+                self.submit(items, train_and_predict_each)
+                return
+            logging.error(f"Training batch of {len(items)} failed: {e}")
+            for _, method, _ in items:
+                # The pool itself failed: retry once on another worker, then
+                # drop to avoid poison loops.
+                self.channel.basic_nack(delivery_tag=method.delivery_tag, requeue=not method.redelivered)
+            return
+
+        if fn is train_and_predict_batch:
+            results = [{"predictions": predictions} for predictions in results]
+        for (_, method, properties), result in zip(items, results):
+            if "error" in result:
+                logging.error(f"Training message failed: {result['error']}")
+            self.publish_result(properties, result)
+            self.channel.basic_ack(delivery_tag=method.delivery_tag)
+
+    def publish_result(self, properties, result):
+        routing_key = properties.reply_to or self.result_queue
+        self.channel.basic_publish(
+            exchange='',
+            routing_key=routing_key,
+            body=json.dumps(result),
+            properties=pika.BasicProperties(
+                correlation_id=properties.correlation_id,
+                content_type='application/json',
+                delivery_mode=2,
+            ),
+        )
+
 if __name__ == '__main__':
-    start()
-```
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--worker', action='store_true', help='durable batched worker mode')
+    parser.add_argument('--prefetch', type=int, default=32)
+    parser.add_argument('--processes', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.worker:
+        TrainingWorker(prefetch=args.prefetch, processes=args.processes).run()
+    else:
+        start()
@@ -1,7 +1,17 @@
-```python
-from hfc.fabric import Client
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+logging.basicConfig(level=logging.INFO)
+
+CHANNEL = 'mychannel'
+PEERS = ['peer0.org1.example.com']
+CHAINCODE = 'maintenancecc'
 
 def record_maintenance_transaction(asset_id, record_data):
+    from hfc.fabric import Client
     client = Client(net_profile="network.json")
     client.new_channel('mychannel')
     transaction = client.chaincode_invoke(
@@ -14,7 +24,192 @@ def record_maintenance_transaction(asset_id, record_data):
     )
     return transaction
 
+class FabricGateway:
+    """One long-lived Fabric client and channel shared by every invocation."""
+
+    def __init__(self, net_profile="network.json", org='org1.example.com', user='Admin'):
+        # Imported here so the mock benchmark runs without the Fabric SDK
+        from hfc.fabric import Client
+        self.client = Client(net_profile=net_profile)
+        self.client.new_channel(CHANNEL)
+        self.requestor = self.client.get_user(org, user)
+
+    async def invoke(self, fcn, args):
+        # wait_for_event makes the call resolve only once the tx is committed
+        return await self.client.chaincode_invoke(
+            requestor=self.requestor,
+            channel_name=CHANNEL,
+            peers=PEERS,
+            args=args,
+            cc_name=CHAINCODE,
+            fcn=fcn,
+            wait_for_event=True,
+        )
+
+class MockGateway:
+    """Offline stand-in for FabricGateway with a fixed per-invocation cost.
+
+    `setup_latency` models building a client and channel, which the legacy
+    record_maintenance_transaction pays on every record.
+    """
+
+    def __init__(self, invoke_latency=0.05, per_record_latency=0.0005, setup_latency=0.0):
+        self.invoke_latency = invoke_latency
+        self.per_record_latency = per_record_latency
+        self.setup_latency = setup_latency
+        self.invocations = 0
+        self.ledger = []
+
+    async def invoke(self, fcn, args):
+        # A batch entry point receives one JSON list; per-record calls get (asset_id, record)
+        records = json.loads(args[0]) if len(args) == 1 else [{"asset_id": args[0], "record": args[1]}]
+        await asyncio.sleep(self.setup_latency + self.invoke_latency + self.per_record_latency * len(records))
+        self.invocations += 1
+        self.ledger.extend(records)
+        return f"tx-{self.invocations}"
+
+class LedgerWriter:
+    """Buffers maintenance records and writes them as batched chaincode invocations.
+
+    A batch is submitted when `batch_size` records are buffered or
+    `flush_interval` seconds pass, with up to `max_in_flight` batches
+    awaiting commit at once. add() returns a future resolving to the
+    transaction id once the record's batch commits. By default each record
+    in a batch is invoked individually and concurrently through `fcn`;
+    set `batch_fcn` only if the chaincode has an entry point that accepts a
+    JSON list of records in one transaction.
+    """
+
+    def __init__(self, gateway, batch_size=50, flush_interval=1.0, max_in_flight=4,
+                 fcn='createMaintenanceRecord', batch_fcn=None):
+        self.gateway = gateway
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fcn = fcn
+        self.batch_fcn = batch_fcn
+        self.in_flight = asyncio.Semaphore(max_in_flight)
+        self.buffer = []
+        self.wake = asyncio.Event()
+        self.pending = set()
+        self.closed = False
+        self.task = None
+        self.committed = 0
+        self.failed = 0
+        self.commit_latencies = []
+
+    def start(self):
+        self.task = asyncio.get_running_loop().create_task(self.run())
+
+    def add(self, asset_id, record_data):
+        if self.closed:
+            raise RuntimeError("ledger writer is closed")
+        future = asyncio.get_running_loop().create_future()
+        self.buffer.append(({"asset_id": asset_id, "record": record_data}, future))
+        if len(self.buffer) >= self.batch_size:
+            self.wake.set()
+        return future
+
+    async def run(self):
+        while not self.closed or self.buffer:
+            timed_out = False
+            try:
+                await asyncio.wait_for(self.wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                timed_out = True
+            self.wake.clear()
+            # Size trigger sends only full batches; the timer and close send the rest too.
+            while len(self.buffer) >= self.batch_size or (self.buffer and (timed_out or self.closed)):
+                batch, self.buffer = self.buffer[:self.batch_size], self.buffer[self.batch_size:]
+                await self.in_flight.acquire()
+                task = asyncio.create_task(self.submit(batch))
+                self.pending.add(task)
+                task.add_done_callback(self.pending.discard)
+
+    async def submit(self, batch):
+        start = time.monotonic()
+        try:
+            if self.batch_fcn:
+                try:
+                    tx_id = await self.gateway.invoke(self.batch_fcn, [json.dumps([record for record, _ in batch])])
+                    outcomes = [tx_id] * len(batch)
+                except Exception as e:
+                    # One transaction: all records commit or none do
+                    outcomes = [e] * len(batch)
+            else:
+                # Each record is its own transaction, so each future gets its
+                # own tx id or error; every invoke finishes before the slot
+                # is released.
+                outcomes = await asyncio.gather(*(
+                    self.gateway.invoke(self.fcn, [record["asset_id"], record["record"]]) for record, _ in batch),
+                    return_exceptions=True)
+        finally:
+            self.in_flight.release()
+
+        failures = [outcome for outcome in outcomes if isinstance(outcome, BaseException)]
+        if failures:
+            logging.error(f"{len(failures)} of {len(batch)} ledger records failed: {failures[0]}")
+        self.failed += len(failures)
+        self.committed += len(batch) - len(failures)
+        self.commit_latencies.append(time.monotonic() - start)
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def close(self):
+        # Flush everything buffered and wait for outstanding commits.
+        self.closed = True
+        self.wake.set()
+        if self.task:
+            await self.task
+        if self.pending:
+            await asyncio.gather(*self.pending, return_exceptions=True)
+
+    def stats(self):
+        latencies = sorted(self.commit_latencies)
+        return {
+            "buffered": len(self.buffer),
+            "batches_in_flight": len(self.pending),
+            "committed": self.committed,
+            "failed": self.failed,
+            "commit_p50_ms": latencies[len(latencies) // 2] * 1000 if latencies else None,
+        }
+
+async def benchmark(records, batch_size, setup_latency, batch_fcn=None):
+    # Legacy pattern: new client/channel and a synchronous invoke per record
+    legacy = MockGateway(setup_latency=setup_latency)
+    start = time.monotonic()
+    for i in range(records):
+        await legacy.invoke('createMaintenanceRecord', [str(i), '{"status": "completed"}'])
+    legacy_rate = records / (time.monotonic() - start)
+
+    gateway = MockGateway()
+    writer = LedgerWriter(gateway, batch_size=batch_size, flush_interval=0.05, batch_fcn=batch_fcn)
+    writer.start()
+    start = time.monotonic()
+    futures = [writer.add(str(i), '{"status": "completed"}') for i in range(records)]
+    await writer.close()
+    await asyncio.gather(*futures)
+    batched_rate = records / (time.monotonic() - start)
+
+    print(f"legacy per-record: {legacy_rate:.0f} records/s ({legacy.invocations} invocations)")
+    print(f"batched writer:    {batched_rate:.0f} records/s ({gateway.invocations} invocations), {writer.stats()}")
+
 if __name__ == "__main__":
-    transaction = record_maintenance_transaction('1', '{"status": "completed"}')
-    print("Transaction ID:", transaction)
-```
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mock-benchmark', action='store_true', help='measure throughput against MockGateway')
+    parser.add_argument('--records', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=50)
+    parser.add_argument('--setup-latency', type=float, default=0.2)
+    parser.add_argument('--batch-fcn', default=None,
+                        help='chaincode function taking a JSON list of records, if the chaincode provides one')
+    args = parser.parse_args()
+
+    if args.mock_benchmark:
+        asyncio.run(benchmark(args.records, args.batch_size, args.setup_latency, args.batch_fcn))
+    else:
+        transaction = record_maintenance_transaction('1', '{"status": "completed"}')
+        print("Transaction ID:", transaction)
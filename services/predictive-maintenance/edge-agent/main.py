@@ -1,7 +1,18 @@
-```python
+import argparse
+import csv
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+
 import tensorflow as tf
 import numpy as np
 
+logging.basicConfig(level=logging.INFO)
+
 def load_model(model_path):
     model = tf.lite.Interpreter(model_path=model_path)
     model.allocate_tensors()
@@ -17,10 +28,173 @@ def predict_anomaly(model, data):
     output_data = model.get_tensor(output_details[0]['index'])
     return output_data
 
+class EdgeAgent:
+    """Keeps one interpreter resident and scores queued sensor windows in batches.
+
+    Windows are put on `windows` as (asset_id, timestamp, array). The worker
+    takes up to `batch_size` of them (waiting at most `max_wait` seconds for
+    a batch to fill), scores them with one invoke, and calls `on_event` only
+    when an asset flips between normal and anomalous.
+    """
+
+    def __init__(self, model_path, threshold=0.5, batch_size=32, max_wait=0.05, on_event=None):
+        self.interpreter = load_model(model_path)
+        input_details = self.interpreter.get_input_details()[0]
+        self.input_index = input_details['index']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
+        self.window_shape = tuple(input_details['shape'][1:])
+        self.batch_rows = None
+
+        self.threshold = threshold
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.on_event = on_event or self.log_event
+        self.windows = queue.Queue(maxsize=batch_size * 64)
+        self.anomalous = defaultdict(bool)
+        self.stopped = threading.Event()
+        self.thread = None
+
+        self.scored = 0
+        self.events = 0
+        self.failed = 0
+        self.rejected = 0
+        self.batch_latencies = deque(maxlen=1000)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        # Scores whatever is still queued before returning.
+        self.stopped.set()
+        self.thread.join()
+
+    def submit(self, asset_id, timestamp, window):
+        self.windows.put((asset_id, timestamp, np.asarray(window, dtype=np.float32).reshape(self.window_shape)))
+
+    def run(self):
+        while not (self.stopped.is_set() and self.windows.empty()):
+            try:
+                batch = [self.windows.get(timeout=0.1)]
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.windows.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            try:
+                self.score_batch(batch)
+            except Exception as e:
+                # Keep consuming; a dead worker would leave submit() blocked
+                # on the full queue forever.
+                self.failed += len(batch)
+                self.batch_rows = None
+                logging.error(f"Scoring {len(batch)} windows failed: {e}")
+
+    def score_batch(self, batch):
+        start = time.perf_counter()
+        inputs = np.stack([window for _, _, window in batch])
+        if self.batch_rows != len(batch):
+            self.interpreter.resize_tensor_input(self.input_index, inputs.shape)
+            self.interpreter.allocate_tensors()
+            self.batch_rows = len(batch)
+        self.interpreter.set_tensor(self.input_index, inputs)
+        self.interpreter.invoke()
+        scores = self.interpreter.get_tensor(self.output_index).reshape(len(batch), -1).max(axis=1)
+        self.batch_latencies.append(time.perf_counter() - start)
+        self.scored += len(batch)
+
+        for (asset_id, timestamp, _), score in zip(batch, scores):
+            anomalous = bool(score > self.threshold)
+            if anomalous != self.anomalous[asset_id]:
+                self.anomalous[asset_id] = anomalous
+                self.events += 1
+                self.on_event({
+                    "asset_id": asset_id,
+                    "timestamp": timestamp,
+                    "state": "anomalous" if anomalous else "normal",
+                    "score": float(score),
+                })
+
+    def log_event(self, event):
+        logging.info(f"Maintenance event: {json.dumps(event)}")
+
+    def stats(self):
+        latencies = np.array(self.batch_latencies) * 1000
+        return {
+            "scored": self.scored,
+            "events": self.events,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "batch_p50_ms": float(np.percentile(latencies, 50)) if len(latencies) else None,
+            "batch_p99_ms": float(np.percentile(latencies, 99)) if len(latencies) else None,
+        }
+
+def serve(agent):
+    # Local queue feed: one JSON object per line on stdin,
+    # {"asset_id": ..., "timestamp": ..., "window": [...]}
+    agent.start()
+    try:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                reading = json.loads(line)
+                agent.submit(reading['asset_id'], reading['timestamp'], reading['window'])
+            except (ValueError, KeyError, TypeError) as e:
+                # One bad reading must not stop the agent
+                agent.rejected += 1
+                logging.error(f"Skipping malformed reading: {e}")
+    finally:
+        agent.stop()
+
+def replay(agent, csv_path, speed):
+    """Streams a recorded CSV (timestamp, asset_id, feature columns...) through the agent.
+
+    Rows are grouped into sliding windows per asset to match the model input;
+    `speed` is the playback multiplier over recorded time, 0 for as fast as possible.
+    """
+    window_rows = agent.window_shape[0] if len(agent.window_shape) > 1 else 1
+    history = defaultdict(lambda: deque(maxlen=window_rows))
+    agent.start()
+    started = time.monotonic()
+    first_ts = None
+    rows = 0
+
+    with open(csv_path, newline='') as f:
+        for record in csv.DictReader(f):
+            timestamp = float(record.pop('timestamp'))
+            asset_id = record.pop('asset_id')
+            if first_ts is None:
+                first_ts = timestamp
+            if speed > 0:
+                delay = (timestamp - first_ts) / speed - (time.monotonic() - started)
+                if delay > 0:
+                    time.sleep(delay)
+            history[asset_id].append([float(value) for value in record.values()])
+            rows += 1
+            if len(history[asset_id]) == window_rows:
+                agent.submit(asset_id, timestamp, np.array(history[asset_id]))
+
+    agent.stop()
+    elapsed = time.monotonic() - started
+    stats = agent.stats()
+    stats.update({"rows": rows, "elapsed_s": elapsed, "windows_per_sec": stats["scored"] / elapsed if elapsed else 0.0})
+    return stats
+
 if __name__ == "__main__":
-    model_path = "model.tflite"
-    model = load_model(model_path)
-    sample_data = np.array([[0.1, 0.2, 0.3]], dtype=np.float32)
-    prediction = predict_anomaly(model, sample_data)
-    print("Prediction:", prediction)
-```
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--model', default='model.tflite')
+    parser.add_argument('--threshold', type=float, default=0.5)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--replay', help='recorded CSV to stream through the agent')
+    parser.add_argument('--speed', type=float, default=0, help='replay speed multiplier, 0 = unthrottled')
+    args = parser.parse_args()
+
+    agent = EdgeAgent(args.model, threshold=args.threshold, batch_size=args.batch_size)
+    if args.replay:
+        print("Replay:", json.dumps(replay(agent, args.replay, args.speed)))
+    else:
+        serve(agent)
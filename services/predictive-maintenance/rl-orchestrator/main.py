@@ -1,16 +1,154 @@
-```python
+import argparse
+import os
+import tempfile
+import time
+
+import joblib
+import pandas as pd
 import ray
 from ray import tune
+from ray.tune import Checkpoint, CheckpointConfig, RunConfig
+from ray.tune.schedulers import ASHAScheduler, FIFOScheduler, MedianStoppingRule
+from ray.tune.search.optuna import OptunaSearch
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
+
+METRIC = "auc"
+ITERS_PER_STEP = 20  # boosting rounds added per reported training step
+
+SEARCH_SPACE = {
+    "learning_rate": tune.loguniform(0.01, 0.3),
+    "max_leaf_nodes": tune.randint(8, 128),
+    "min_samples_leaf": tune.randint(5, 100),
+    "l2_regularization": tune.loguniform(1e-4, 10.0),
+}
+
+GRID_SPACE = {
+    "learning_rate": tune.grid_search([0.03, 0.1, 0.3]),
+    "max_leaf_nodes": tune.grid_search([15, 31, 63]),
+    "min_samples_leaf": tune.grid_search([10, 50]),
+    "l2_regularization": tune.grid_search([0.0, 1.0]),
+}
+
+def load_data(csv_file_path):
+    # Same layout as the root train_model.py: device readings plus a `failure` label
+    data = pd.read_csv(csv_file_path)
+    X = data.drop('failure', axis=1).to_numpy()
+    y = data['failure'].to_numpy()
+    return train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+
+def training_function(config, data):
+    X_train, X_val, y_train, y_val = data
+    model = HistGradientBoostingClassifier(
+        learning_rate=config["learning_rate"],
+        max_leaf_nodes=config["max_leaf_nodes"],
+        min_samples_leaf=config["min_samples_leaf"],
+        l2_regularization=config["l2_regularization"],
+        early_stopping=False,
+        warm_start=True,
+    )
+    step = 0
+
+    # Resume from the trial's last checkpoint after an interrupted sweep
+    checkpoint = tune.get_checkpoint()
+    if checkpoint:
+        with checkpoint.as_directory() as checkpoint_dir:
+            model, step = joblib.load(os.path.join(checkpoint_dir, "model.pkl"))
+
+    while step < config["max_steps"]:
+        step += 1
+        # warm_start keeps the existing trees and only fits the new rounds
+        model.set_params(max_iter=step * ITERS_PER_STEP)
+        model.fit(X_train, y_train)
+        score = roc_auc_score(y_val, model.predict_proba(X_val)[:, 1])
 
-def training_function(config):
-    for i in range(10):
-        intermediate_score = i * config["factor"]
-        tune.report(score=intermediate_score)
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            joblib.dump((model, step), os.path.join(checkpoint_dir, "model.pkl"))
+            # wall_time lets time_to_best measure sub-second progress; Ray's
+            # own `timestamp` only has whole-second resolution.
+            tune.report({METRIC: score, "step": step, "wall_time": time.time()},
+                        checkpoint=Checkpoint.from_directory(checkpoint_dir))
+
+def build_scheduler(name, max_steps):
+    if name == "asha":
+        return ASHAScheduler(time_attr="step", max_t=max_steps, grace_period=2, reduction_factor=3)
+    if name == "median":
+        return MedianStoppingRule(time_attr="step", grace_period=2, min_samples_required=3)
+    return FIFOScheduler()
+
+def run_sweep(name, data, param_space, args, scheduler, search_alg=None, num_samples=1):
+    trainable = tune.with_resources(
+        tune.with_parameters(training_function, data=data),
+        {"cpu": args.cpus_per_trial},
+    )
+    path = os.path.join(os.path.abspath(args.storage), name)
+    if tune.Tuner.can_restore(path):
+        tuner = tune.Tuner.restore(path, trainable=trainable, resume_errored=True)
+    else:
+        tuner = tune.Tuner(
+            trainable,
+            param_space={**param_space, "max_steps": args.max_steps},
+            tune_config=tune.TuneConfig(
+                metric=METRIC,
+                mode="max",
+                scheduler=scheduler,
+                search_alg=search_alg,
+                num_samples=num_samples,
+                max_concurrent_trials=args.max_concurrent,
+            ),
+            run_config=RunConfig(
+                name=name,
+                storage_path=os.path.abspath(args.storage),
+                checkpoint_config=CheckpointConfig(num_to_keep=1),
+            ),
+        )
+    return tuner.fit()
+
+def time_to_best(results, start):
+    """Wall-clock seconds from `start` (time.time() at sweep launch) until the
+    sweep's best score was first reported."""
+    history = pd.concat([result.metrics_dataframe for result in results if result.metrics_dataframe is not None],
+                        ignore_index=True)
+    best = history[METRIC].max()
+    reached = history.loc[history[METRIC] >= best, "wall_time"].min()
+    return best, float(reached - start), len(results), int(history.shape[0])
+
+def report(rows):
+    print(f"\n{'sweep':<14}{'best auc':>10}{'time to best s':>16}{'wall s':>9}{'trials':>8}{'steps':>8}")
+    for name, (best, to_best, trials, steps), wall in rows:
+        print(f"{name:<14}{best:>10.4f}{to_best:>16.1f}{wall:>9.1f}{trials:>8}{steps:>8}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--data', default='device_data.csv')
+    parser.add_argument('--scheduler', choices=['asha', 'median'], default='asha')
+    parser.add_argument('--num-samples', type=int, default=36)
+    parser.add_argument('--max-steps', type=int, default=15)
+    parser.add_argument('--cpus-per-trial', type=float, default=1)
+    parser.add_argument('--max-concurrent', type=int, default=None)
+    parser.add_argument('--storage', default='ray_results')
+    parser.add_argument('--compare-grid', action='store_true', help='also run the exhaustive grid and compare')
+    args = parser.parse_args()
+
     ray.init()
-    tune.run(
-        training_function,
-        config={"factor": tune.grid_search([0.1, 0.2, 0.3])}
+    data = load_data(args.data)
+    rows = []
+
+    start = time.time()
+    results = run_sweep(
+        f"maintenance-{args.scheduler}", data, SEARCH_SPACE, args,
+        scheduler=build_scheduler(args.scheduler, args.max_steps),
+        search_alg=OptunaSearch(),
+        num_samples=args.num_samples,
     )
-```
\ No newline at end of file
+    rows.append((args.scheduler, time_to_best(results, start), time.time() - start))
+    best = results.get_best_result()
+    print("Best config:", best.config, "checkpoint:", best.checkpoint)
+
+    if args.compare_grid:
+        start = time.time()
+        grid_results = run_sweep("maintenance-grid", data, GRID_SPACE, args, scheduler=FIFOScheduler())
+        rows.append(("grid", time_to_best(grid_results, start), time.time() - start))
+
+    report(rows)
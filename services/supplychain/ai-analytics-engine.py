@@ -1,9 +1,14 @@
-```python
+import argparse
+import os
+import time
+
 import tensorflow as tf
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
+AUTOTUNE = tf.data.AUTOTUNE
+
 def build_model(input_shape):
     model = tf.keras.Sequential([
         tf.keras.layers.InputLayer(input_shape=input_shape),
@@ -23,11 +28,138 @@ def predict(model, input_data):
     logging.info(f"Model prediction: {prediction}")
     return prediction
 
+def make_dataset(file_pattern, num_features, batch_size=1024, shuffle_buffer=10000, cache_path=None, training=True):
+    """Streams sharded CSV files (header row; num_features feature columns, then the label).
+
+    Shards are read in parallel with interleave, whole batches of lines are
+    parsed at once, and the parsed stream can be cached to `cache_path` so
+    later epochs skip parsing. Nothing is held in memory beyond the shuffle
+    and prefetch buffers.
+    """
+    files = tf.data.Dataset.list_files(file_pattern, shuffle=training)
+    lines = files.interleave(
+        lambda path: tf.data.TextLineDataset(path).skip(1),
+        cycle_length=AUTOTUNE,
+        num_parallel_calls=AUTOTUNE,
+        deterministic=not training,
+    )
+    defaults = [[0.0]] * (num_features + 1)
+
+    def parse(batch):
+        columns = tf.io.decode_csv(batch, record_defaults=defaults)
+        return tf.stack(columns[:-1], axis=1), tf.expand_dims(columns[-1], 1)
+
+    dataset = lines.batch(batch_size).map(parse, num_parallel_calls=AUTOTUNE)
+    if cache_path is not None:
+        dataset = dataset.cache(cache_path)
+    if training:
+        dataset = dataset.unbatch().shuffle(shuffle_buffer).batch(batch_size)
+    return dataset.prefetch(AUTOTUNE)
+
+def train_streaming(model, train_pattern, val_pattern, num_features, checkpoint_dir, epochs=50, patience=5,
+                    batch_size=1024, cache_dir=None):
+    """Trains from streamed shards with early stopping and checkpoint/resume.
+
+    The epoch counter, best validation loss and patience counter live in the
+    checkpoint next to the weights and optimizer, so an interrupted run
+    resumes where it stopped. Returns per-epoch stats including examples/sec
+    and input stall time (time spent waiting on the input pipeline).
+    """
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    train_ds = make_dataset(train_pattern, num_features, batch_size,
+                            cache_path=f"{cache_dir}/train" if cache_dir else None)
+    val_ds = make_dataset(val_pattern, num_features, batch_size,
+                          cache_path=f"{cache_dir}/val" if cache_dir else None, training=False)
+
+    optimizer = model.optimizer
+    loss_fn = tf.keras.losses.MeanSquaredError()
+    epoch = tf.Variable(0, dtype=tf.int64)
+    best_val_loss = tf.Variable(float('inf'), dtype=tf.float64)
+    bad_epochs = tf.Variable(0, dtype=tf.int64)
+    checkpoint = tf.train.Checkpoint(model=model, optimizer=optimizer, epoch=epoch,
+                                     best_val_loss=best_val_loss, bad_epochs=bad_epochs)
+    manager = tf.train.CheckpointManager(checkpoint, checkpoint_dir, max_to_keep=2)
+    best = tf.train.Checkpoint(model=model)
+    if manager.latest_checkpoint:
+        checkpoint.restore(manager.latest_checkpoint)
+        logging.info(f"Resumed from {manager.latest_checkpoint} at epoch {int(epoch)}")
+
+    @tf.function
+    def train_step(features, labels):
+        with tf.GradientTape() as tape:
+            loss = loss_fn(labels, model(features, training=True))
+        optimizer.apply_gradients(zip(tape.gradient(loss, model.trainable_variables), model.trainable_variables))
+        return loss
+
+    @tf.function
+    def val_step(features, labels):
+        return loss_fn(labels, model(features, training=False)), tf.shape(labels)[0]
+
+    history = []
+    while int(epoch) < epochs and int(bad_epochs) < patience:
+        examples = 0
+        stall = 0.0
+        loss = float('nan')
+        started = time.perf_counter()
+        iterator = iter(train_ds)
+        while True:
+            wait_start = time.perf_counter()
+            try:
+                features, labels = next(iterator)
+            except StopIteration:
+                break
+            stall += time.perf_counter() - wait_start
+            loss = train_step(features, labels)
+            examples += int(tf.shape(labels)[0])
+        elapsed = time.perf_counter() - started
+
+        total, count = 0.0, 0
+        for features, labels in val_ds:
+            batch_loss, size = val_step(features, labels)
+            total += float(batch_loss) * int(size)
+            count += int(size)
+        val_loss = total / max(count, 1)
+
+        epoch.assign_add(1)
+        if val_loss < float(best_val_loss):
+            best_val_loss.assign(val_loss)
+            bad_epochs.assign(0)
+            best.write(f"{checkpoint_dir}/best")
+        else:
+            bad_epochs.assign_add(1)
+        manager.save()
+
+        stats = {
+            "epoch": int(epoch),
+            "loss": float(loss),
+            "val_loss": val_loss,
+            "examples_per_sec": examples / elapsed if elapsed else 0.0,
+            "input_stall_s": stall,
+            "stall_fraction": stall / elapsed if elapsed else 0.0,
+        }
+        history.append(stats)
+        logging.info(f"Epoch stats: {stats}")
+
+    if int(bad_epochs) >= patience:
+        logging.info(f"Early stopping after epoch {int(epoch)}; restoring best weights")
+    if tf.io.gfile.exists(f"{checkpoint_dir}/best.index"):
+        best.read(f"{checkpoint_dir}/best").expect_partial()
+    logging.info("Model training complete.")
+    return history
+
 if __name__ == "__main__":
-    # Example usage
-    model = build_model((10,))
-    # Assume train_data and train_labels are available
-    train_model(model, train_data, train_labels)
-    # Assume input_data is available
-    prediction = predict(model, input_data)
-```
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--train', required=True, help='glob of training CSV shards')
+    parser.add_argument('--val', required=True, help='glob of validation CSV shards')
+    parser.add_argument('--features', type=int, default=10)
+    parser.add_argument('--checkpoint-dir', default='checkpoints/supplychain')
+    parser.add_argument('--cache-dir', default=None)
+    parser.add_argument('--epochs', type=int, default=50)
+    parser.add_argument('--patience', type=int, default=5)
+    parser.add_argument('--batch-size', type=int, default=1024)
+    args = parser.parse_args()
+
+    model = build_model((args.features,))
+    train_streaming(model, args.train, args.val, args.features, args.checkpoint_dir, epochs=args.epochs,
+                    patience=args.patience, batch_size=args.batch_size, cache_dir=args.cache_dir)
@@ -1,36 +1,92 @@
-```python
 import tensorflowjs as tfjs
 import tensorflow as tf
+import numpy as np
 import json
+import os
+
+INPUT_SIZE = 10  # Example input shape
+INFERENCE_ARTIFACT = 'model.tflite'
 
 class AIOptimizationEngine:
-    def __init__(self):
-        # Initialize the TensorFlow model here
-        self.model = self.build_model()
+    def __init__(self, model_path=None):
+        # Load a trained artifact once if given, otherwise start from a fresh model
+        self.interpreter = None
+        if model_path is None:
+            self.model = self.build_model()
+        elif model_path.endswith('.tflite'):
+            self.model = None
+            self.load_inference_artifact(model_path)
+        else:
+            self.model = tf.keras.models.load_model(model_path, compile=False)
+        if self.model is not None:
+            self.forward = tf.function(
+                lambda x: self.model(x, training=False),
+                input_signature=[tf.TensorSpec([None, INPUT_SIZE], tf.float32)],
+            )
 
     def build_model(self):
         model = tf.keras.Sequential([
-            tf.keras.layers.Dense(64, activation='relu', input_shape=(10,)),  # Example input shape
+            tf.keras.layers.Dense(64, activation='relu', input_shape=(INPUT_SIZE,)),
             tf.keras.layers.Dense(32, activation='relu'),
             tf.keras.layers.Dense(1, activation='linear')
         ])
         model.compile(optimizer='adam', loss='mean_squared_error')
         return model
 
+    def load_inference_artifact(self, file_path):
+        self.interpreter = tf.lite.Interpreter(model_path=file_path)
+        self.input_index = self.interpreter.get_input_details()[0]['index']
+        self.output_index = self.interpreter.get_output_details()[0]['index']
+        self.interpreter_batch = None
+
     def optimize(self, input_data):
-        # Convert JSON input to numpy array for model input
-        input_array = json.loads(input_data)
-        predictions = self.model.predict(input_array)
-        return predictions
+        # Accepts a NumPy array (or nested list) of shape (n, INPUT_SIZE);
+        # JSON strings are still parsed for backwards compatibility.
+        if isinstance(input_data, (str, bytes)):
+            input_data = json.loads(input_data)
+        input_array = np.asarray(input_data, dtype=np.float32).reshape(-1, INPUT_SIZE)
+        if self.interpreter is not None:
+            return self.run_interpreter(input_array)
+        return self.forward(input_array).numpy()
+
+    def optimize_batch(self, requests):
+        # Score many optimization requests in a single forward pass and split
+        # the predictions back per request.
+        arrays = [np.asarray(r, dtype=np.float32).reshape(-1, INPUT_SIZE) for r in requests]
+        if not arrays:
+            return []
+        predictions = self.optimize(np.concatenate(arrays))
+        return np.split(predictions, np.cumsum([len(a) for a in arrays])[:-1])
+
+    def run_interpreter(self, input_array):
+        if self.interpreter_batch != len(input_array):
+            self.interpreter.resize_tensor_input(self.input_index, input_array.shape)
+            self.interpreter.allocate_tensors()
+            self.interpreter_batch = len(input_array)
+        self.interpreter.set_tensor(self.input_index, input_array)
+        self.interpreter.invoke()
+        return self.interpreter.get_tensor(self.output_index).copy()
 
     def save_model(self, file_path):
         tfjs.converters.save_keras_model(self.model, file_path)
+        # Compact TFLite artifact for serving: AIOptimizationEngine(<path>/model.tflite)
+        self.export_inference_artifact(os.path.join(file_path, INFERENCE_ARTIFACT))
+
+    def export_inference_artifact(self, file_path):
+        converter = tf.lite.TFLiteConverter.from_concrete_functions(
+            [self.forward.get_concrete_function()], self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        with open(file_path, 'wb') as f:
+            f.write(converter.convert())
+        return file_path
 
 # Example usage
 if __name__ == "__main__":
     engine = AIOptimizationEngine()
-    sample_input = json.dumps([[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]])
+    sample_input = np.array([[0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]], dtype=np.float32)
     result = engine.optimize(sample_input)
     print("Optimized Result:", result)
+    print("Batched Results:", engine.optimize_batch([sample_input, sample_input * 2]))
     engine.save_model('./model_output/')
-```
\ No newline at end of file
+    serving_engine = AIOptimizationEngine('./model_output/' + INFERENCE_ARTIFACT)
+    print("Artifact Result:", serving_engine.optimize(sample_input))
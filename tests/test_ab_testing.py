@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from ab_testing.run_ab_test import VariantAggregates, analyze, ingest, simulate_events
+
+
+class TestVariantAggregates(unittest.TestCase):
+    def test_chunked_aggregates_match_numpy(self):
+        variants, values = simulate_events(50_000, seed=1)
+        aggregates = VariantAggregates(sample_size=1000, seed=1)
+        for start in range(0, len(values), 7_000):
+            aggregates.add(variants[start:start + 7_000], values[start:start + 7_000])
+
+        for variant in ('A', 'B'):
+            group = values[variants == variant]
+            summary = aggregates.summary(variant)
+            self.assertEqual(summary["n"], len(group))
+            self.assertAlmostEqual(summary["mean"], group.mean(), places=9)
+            self.assertAlmostEqual(summary["variance"], group.var(ddof=1), places=6)
+            self.assertEqual(summary["conversions"], int((group > 0).sum()))
+            self.assertEqual(len(aggregates.sample_values[variant]), 1000)
+
+    def test_ingest_reads_csv_in_chunks(self):
+        variants, values = simulate_events(5_000, seed=2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'events.csv')
+            with open(path, 'w') as f:
+                f.write('variant,value\n')
+                f.writelines(f'{v},{x}\n' for v, x in zip(variants, values))
+            aggregates = ingest(path, chunk_size=999)
+
+        self.assertEqual(int(aggregates.n.sum()), 5_000)
+        self.assertAlmostEqual(aggregates.summary('B')["mean"], values[variants == 'B'].mean(), places=9)
+
+
+class TestAnalyze(unittest.TestCase):
+    def test_detects_lift_and_interval_covers_difference(self):
+        aggregates = VariantAggregates(seed=3).add(*simulate_events(400_000, lift=0.02, seed=3))
+        comparison = analyze(aggregates, control='A', resamples=200, seed=3)["comparisons"]['B']
+
+        low, high = comparison["bootstrap_ci"]
+        self.assertLess(low, comparison["sequential"]["difference"])
+        self.assertGreater(high, comparison["sequential"]["difference"])
+        self.assertGreater(low, 0)
+        self.assertLess(comparison["sequential"]["always_valid_p"], 0.05)
+        self.assertGreater(comparison["bayesian"]["p_b_beats_a_conversion"], 0.99)
+
+    def test_no_lift_is_not_significant(self):
+        aggregates = VariantAggregates(seed=4).add(*simulate_events(100_000, lift=0.0, seed=4))
+        comparison = analyze(aggregates, control='A', resamples=200, seed=4)["comparisons"]['B']
+
+        self.assertGreater(comparison["sequential"]["always_valid_p"], 0.05)
+
+    def test_missing_group_is_reported_not_divided_by(self):
+        aggregates = VariantAggregates().add(np.array(['A', 'A', 'A']), np.array([1.0, 0.0, 2.0]))
+
+        self.assertEqual(analyze(aggregates)["comparisons"], {})
+        with self.assertRaises(ValueError):
+            analyze(VariantAggregates())
+
+
+if __name__ == '__main__':
+    unittest.main()
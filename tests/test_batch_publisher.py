@@ -0,0 +1,125 @@
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import zlib
+
+from edge.batch_publisher import BatchPublisher
+
+
+class PublishInfo:
+    def __init__(self, rc):
+        self.rc = rc
+
+
+class LocalBroker:
+    """Stand-in for an MQTT broker plus the paho client talking to it."""
+
+    def __init__(self):
+        self.connected = True
+        self.messages = []
+        self.lock = threading.Lock()
+
+    def is_connected(self):
+        return self.connected
+
+    def publish(self, topic, payload, qos=0):
+        if not self.connected:
+            return PublishInfo(4)  # MQTT_ERR_NO_CONN
+        with self.lock:
+            self.messages.append((topic, payload, qos))
+        return PublishInfo(0)
+
+    def readings(self):
+        with self.lock:
+            return [r for _, payload, _ in self.messages for r in json.loads(zlib.decompress(payload))]
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestBatchPublisher(unittest.TestCase):
+    def setUp(self):
+        self.spool_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.spool_dir)
+        self.broker = LocalBroker()
+
+    def make_publisher(self, **kwargs):
+        options = dict(batch_size=10, flush_interval=60, spool_dir=self.spool_dir, drain_rate=100)
+        options.update(kwargs)
+        publisher = BatchPublisher(self.broker, 'sensor/data', **options)
+        self.addCleanup(publisher.close)
+        return publisher
+
+    def test_publishes_on_batch_size(self):
+        publisher = self.make_publisher()
+        for i in range(25):
+            publisher.add({'i': i})
+
+        self.assertTrue(wait_for(lambda: len(self.broker.messages) == 2))
+        self.assertEqual(self.broker.readings(), [{'i': i} for i in range(20)])
+        self.assertEqual(self.broker.messages[0][2], 1)
+
+    def test_publishes_on_interval(self):
+        publisher = self.make_publisher(flush_interval=0.05)
+        publisher.add({'i': 0})
+
+        self.assertTrue(wait_for(lambda: len(self.broker.messages) == 1))
+
+    def test_ring_buffer_drops_oldest(self):
+        publisher = self.make_publisher(batch_size=100, capacity=5)
+        for i in range(8):
+            publisher.add({'i': i})
+        publisher.flush()
+
+        self.assertEqual(self.broker.readings(), [{'i': i} for i in range(3, 8)])
+        self.assertEqual(publisher.stats()['dropped'], 3)
+
+    def test_spools_offline_and_drains_in_order(self):
+        publisher = self.make_publisher()
+        self.broker.connected = False
+        for i in range(30):
+            publisher.add({'i': i})
+        self.assertTrue(wait_for(lambda: publisher.stats()['spooled'] == 3))
+        self.assertEqual(self.broker.messages, [])
+
+        self.broker.connected = True
+        publisher.add({'i': 30})
+        publisher.flush()
+        self.assertTrue(wait_for(lambda: publisher.stats()['spooled'] == 0))
+        self.assertEqual(self.broker.readings(), [{'i': i} for i in range(31)])
+
+    def test_spool_survives_restart(self):
+        self.broker.connected = False
+        publisher = BatchPublisher(self.broker, 'sensor/data', batch_size=10, spool_dir=self.spool_dir)
+        for i in range(5):
+            publisher.add({'i': i})
+        publisher.close()
+
+        self.broker.connected = True
+        self.make_publisher()
+        self.assertTrue(wait_for(lambda: len(self.broker.messages) == 1))
+        self.assertEqual(self.broker.readings(), [{'i': i} for i in range(5)])
+
+    def test_drain_is_rate_limited(self):
+        publisher = self.make_publisher(drain_rate=5)
+        self.broker.connected = False
+        for i in range(40):
+            publisher.add({'i': i})
+        self.assertTrue(wait_for(lambda: publisher.stats()['spooled'] == 4))
+
+        self.broker.connected = True
+        time.sleep(0.3)
+        self.assertLessEqual(len(self.broker.messages), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
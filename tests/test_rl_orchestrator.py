@@ -0,0 +1,90 @@
+import argparse
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), '..', 'services', 'predictive-maintenance',
+                           'rl-orchestrator', 'main.py')
+HAS_RAY = all(importlib.util.find_spec(name) for name in ('ray', 'optuna'))
+
+
+def load_orchestrator():
+    spec = importlib.util.spec_from_file_location('rl_orchestrator', MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def trial(wall_times, aucs):
+    return SimpleNamespace(metrics_dataframe=pd.DataFrame({"wall_time": wall_times, "auc": aucs}))
+
+
+@unittest.skipUnless(HAS_RAY, 'ray/optuna are not installed')
+class TestTimeToBest(unittest.TestCase):
+    def setUp(self):
+        self.orchestrator = load_orchestrator()
+
+    def test_multiple_trials(self):
+        results = [
+            trial([100.2, 100.4, 100.6], [0.70, 0.80, 0.82]),
+            trial([100.3, 100.5], [0.75, 0.90]),
+            SimpleNamespace(metrics_dataframe=None),
+        ]
+
+        best, to_best, trials, steps = self.orchestrator.time_to_best(results, start=100.0)
+
+        self.assertEqual(best, 0.90)
+        self.assertAlmostEqual(to_best, 0.5)
+        self.assertEqual((trials, steps), (3, 5))
+        self.orchestrator.report([("asha", (best, to_best, trials, steps), 10.0)])
+
+    def test_single_trial(self):
+        best, to_best, _, _ = self.orchestrator.time_to_best([trial([50.25, 51.0], [0.6, 0.6])], start=50.0)
+
+        self.assertEqual(best, 0.6)
+        self.assertAlmostEqual(to_best, 0.25)
+
+
+@unittest.skipUnless(HAS_RAY, 'ray/optuna are not installed')
+class TestSweepSmoke(unittest.TestCase):
+    def setUp(self):
+        self.orchestrator = load_orchestrator()
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+
+        rng = np.random.default_rng(0)
+        features = rng.normal(size=(200, 3))
+        frame = pd.DataFrame(features, columns=['temperature', 'vibration', 'pressure'])
+        frame['failure'] = (features[:, 0] + features[:, 1] > 0).astype(int)
+        self.csv_path = os.path.join(self.directory, 'device_data.csv')
+        frame.to_csv(self.csv_path, index=False)
+
+    def test_two_trial_sweep_completes(self):
+        import ray
+        ray.init(num_cpus=2, include_dashboard=False, ignore_reinit_error=True)
+        self.addCleanup(ray.shutdown)
+
+        args = argparse.Namespace(scheduler='asha', max_steps=2, cpus_per_trial=1, max_concurrent=2,
+                                  storage=os.path.join(self.directory, 'ray_results'))
+        start = self.orchestrator.time.time()
+        results = self.orchestrator.run_sweep(
+            'smoke', self.orchestrator.load_data(self.csv_path), self.orchestrator.SEARCH_SPACE, args,
+            scheduler=self.orchestrator.build_scheduler('asha', args.max_steps),
+            search_alg=self.orchestrator.OptunaSearch(), num_samples=2)
+
+        self.assertEqual(len(results), 2)
+        self.assertFalse(results.errors)
+        best, to_best, trials, _ = self.orchestrator.time_to_best(results, start)
+        self.assertGreater(best, 0.5)
+        self.assertGreater(to_best, 0)
+        self.assertEqual(trials, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
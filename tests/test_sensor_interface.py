@@ -0,0 +1,55 @@
+import struct
+import time
+import unittest
+
+import numpy as np
+
+from edge.sensor_interface import MPU6050Sampler, SensorInterface, SimulatedBus
+
+
+class FixedBus(SimulatedBus):
+    def __init__(self, values):
+        super().__init__()
+        self.block = list(struct.pack('>7h', *values))
+
+    def read_i2c_block_data(self, address, register, length):
+        self.block_reads += 1
+        return self.block[:length]
+
+
+class TestSensorInterface(unittest.TestCase):
+    def test_burst_read_decodes_signed_values(self):
+        values = (-16384, 1, 16384, -32768, 32767, -1, 0)
+        sensor = SensorInterface(bus=FixedBus(values))
+
+        self.assertEqual(sensor.read_mpu6050_burst().tolist(), list(values))
+        self.assertEqual(sensor.bus.block_reads, 1)
+
+    def test_configure_sets_sample_rate_divider(self):
+        bus = SimulatedBus()
+        SensorInterface(bus=bus).configure_mpu6050(sample_rate_hz=200)
+
+        self.assertEqual(bus.registers[(0x68, 0x6B)], 0)
+        self.assertEqual(bus.registers[(0x68, 0x19)], 4)
+
+    def test_sampler_fills_ring_buffer_in_order(self):
+        sampler = MPU6050Sampler(SensorInterface(bus=SimulatedBus()), rate_hz=2000, capacity=64)
+        sampler.run(max_samples=100)
+
+        timestamps, samples = sampler.latest()
+        self.assertEqual(sampler.count, 100)
+        self.assertEqual(samples.shape, (64, 7))
+        self.assertTrue(np.all(np.diff(timestamps) > 0))
+        self.assertTrue(np.all(np.abs(samples[:, 2] - 16384) < 1000))
+
+    def test_sampler_holds_target_rate(self):
+        sampler = MPU6050Sampler(SensorInterface(bus=SimulatedBus()), rate_hz=200)
+        start = time.monotonic()
+        sampler.run(max_samples=40)
+
+        self.assertGreaterEqual(time.monotonic() - start, 39 / 200)
+        self.assertEqual(sampler.missed, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import importlib.util
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), '..', 'services', 'learning-engine',
+                           'task_queue_connector.py')
+
+HAS_AIOHTTP = importlib.util.find_spec('aiohttp') is not None and importlib.util.find_spec('requests') is not None
+if HAS_AIOHTTP:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    spec = importlib.util.spec_from_file_location('task_queue_connector', MODULE_PATH)
+    task_queue_connector = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(task_queue_connector)
+
+
+class QueueStub:
+    """Task queue stand-in: fails the first `failures` requests with 503,
+    rejects any task marked "bad" with 400, and records accepted tasks."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.requests = 0
+        self.accepted = []
+
+    async def handle(self, request):
+        self.requests += 1
+        body = await request.json()
+        tasks = body["tasks"] if request.path.endswith('/bulk') else [body]
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=503)
+        if any(task.get("bad") for task in tasks):
+            return web.Response(status=400)
+        self.accepted.extend(tasks)
+        return web.json_response({"ok": True})
+
+    def app(self):
+        app = web.Application()
+        app.router.add_post('/tasks', self.handle)
+        app.router.add_post('/tasks/bulk', self.handle)
+        return app
+
+
+@unittest.skipUnless(HAS_AIOHTTP, 'aiohttp is not installed')
+class TestAsyncTaskQueueClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.spill_path = os.path.join(self.directory, 'spill.jsonl')
+        self.rejected_path = os.path.join(self.directory, 'rejected.jsonl')
+
+    async def serve(self, stub):
+        server = TestServer(stub.app())
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+        return str(server.make_url('/tasks'))
+
+    def client(self, url, **kwargs):
+        return task_queue_connector.AsyncTaskQueueClient(
+            url, batch_size=10, max_retries=2, backoff_base=0.001, backoff_cap=0.01,
+            spill_path=self.spill_path, rejected_path=self.rejected_path, **kwargs)
+
+    def read_lines(self, path):
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+
+    async def test_retries_transient_errors(self):
+        stub = QueueStub(failures=2)
+        async with self.client(await self.serve(stub)) as client:
+            sent = await client.enqueue_many([{"id": i} for i in range(5)])
+
+        self.assertEqual(sent, 5)
+        self.assertEqual(client.retries, 2)
+        self.assertEqual(len(stub.accepted), 5)
+        self.assertFalse(os.path.exists(self.spill_path))
+
+    async def test_spills_when_retries_exhausted_and_drains_on_start(self):
+        stub = QueueStub(failures=3)
+        async with self.client(await self.serve(stub)) as client:
+            sent = await client.enqueue_many([{"id": i} for i in range(5)])
+        self.assertEqual((sent, client.spilled), (0, 5))
+        self.assertEqual(len(self.read_lines(self.spill_path)), 5)
+
+        async with self.client(client.queue_url) as restarted:
+            pass
+        self.assertEqual(restarted.enqueued, 5)
+        self.assertEqual(sorted(task["id"] for task in stub.accepted), list(range(5)))
+        self.assertFalse(os.path.exists(self.spill_path))
+
+    async def test_rejected_tasks_are_isolated_and_not_spilled(self):
+        stub = QueueStub()
+        tasks = [{"id": i} for i in range(5)] + [{"id": 5, "bad": True}]
+        async with self.client(await self.serve(stub)) as client:
+            sent = await client.enqueue_many(tasks)
+
+        self.assertEqual(sent, 5)
+        self.assertEqual((client.rejected, client.spilled), (1, 0))
+        self.assertEqual(self.read_lines(self.rejected_path), [{"id": 5, "bad": True}])
+        self.assertFalse(os.path.exists(self.spill_path))
+
+    async def test_leftover_draining_file_is_resent(self):
+        with open(self.spill_path + '.draining', 'w') as f:
+            f.write(json.dumps({"id": 1}) + '\n')
+        with open(self.spill_path, 'w') as f:
+            f.write(json.dumps({"id": 2}) + '\n')
+
+        stub = QueueStub()
+        async with self.client(await self.serve(stub)):
+            pass
+
+        self.assertEqual(sorted(task["id"] for task in stub.accepted), [1, 2])
+        self.assertFalse(os.path.exists(self.spill_path + '.draining'))
+
+
+if __name__ == '__main__':
+    unittest.main()